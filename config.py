@@ -61,3 +61,4 @@ AMADEUS_USE_PRODUCTION: Final[bool] = os.getenv("AMADEUS_USE_PRODUCTION", "false
 CASCADE_ENABLED: Final[bool] = os.getenv("CASCADE_ENABLED", "true").lower() == "true"
 CACHE_TTL_HOURS: Final[int] = int(os.getenv("CACHE_TTL_HOURS", "24"))
 CACHE_FILE: Final[str] = os.getenv("CACHE_FILE", "cache/prices_cache.json")
+CACHE_MAX_ENTRIES: Final[int] = int(os.getenv("CACHE_MAX_ENTRIES", "10000"))
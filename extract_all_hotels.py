@@ -10,6 +10,7 @@ import sys
 from typing import Any, Dict, List, Optional, TypedDict
 
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font, PatternFill, Alignment
 
 import config
@@ -88,40 +89,47 @@ def save_to_excel(hotel_data: List[HotelData], filename: str) -> None:
     """
     logger.info("Saving to %s...", filename)
 
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Hotels Puerto Rico"
+    # Write-only mode streams rows straight to the file instead of
+    # building a Cell object for every value
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(title="Hotels Puerto Rico")
+
+    # Column widths must be set before any row is written
+    ws.column_dimensions['A'].width = 6
+    ws.column_dimensions['B'].width = 50
+    ws.column_dimensions['C'].width = 20
+    ws.column_dimensions['D'].width = 80
+    ws.column_dimensions['E'].width = 20
+    ws.column_dimensions['F'].width = 10
+    ws.column_dimensions['G'].width = 10
 
     # Header styling
     header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
     header_font = Font(color="FFFFFF", bold=True)
+    header_alignment = Alignment(horizontal='center')
 
     # Headers
     headers = ["#", "Hotel Name", "Key", "URL", "Type", "Rating", "Reviews"]
-    for col, header in enumerate(headers, 1):
-        cell = ws.cell(row=1, column=col, value=header)
+    header_row = []
+    for header in headers:
+        cell = WriteOnlyCell(ws, value=header)
         cell.fill = header_fill
         cell.font = header_font
-        cell.alignment = Alignment(horizontal='center')
+        cell.alignment = header_alignment
+        header_row.append(cell)
+    ws.append(header_row)
 
     # Data rows
     for idx, hotel in enumerate(hotel_data, 1):
-        ws.cell(row=idx + 1, column=1, value=idx)
-        ws.cell(row=idx + 1, column=2, value=hotel["name"])
-        ws.cell(row=idx + 1, column=3, value=hotel["key"])
-        ws.cell(row=idx + 1, column=4, value=hotel["url"])
-        ws.cell(row=idx + 1, column=5, value=hotel["accommodation_type"])
-        ws.cell(row=idx + 1, column=6, value=hotel["rating"])
-        ws.cell(row=idx + 1, column=7, value=hotel["review_count"])
-
-    # Adjust column widths
-    ws.column_dimensions['A'].width = 6
-    ws.column_dimensions['B'].width = 50
-    ws.column_dimensions['C'].width = 20
-    ws.column_dimensions['D'].width = 80
-    ws.column_dimensions['E'].width = 20
-    ws.column_dimensions['F'].width = 10
-    ws.column_dimensions['G'].width = 10
+        ws.append((
+            idx,
+            hotel["name"],
+            hotel["key"],
+            hotel["url"],
+            hotel["accommodation_type"],
+            hotel["rating"],
+            hotel["review_count"],
+        ))
 
     wb.save(filename)
     logger.info("Saved %d hotels to Excel", len(hotel_data))
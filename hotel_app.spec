@@ -71,6 +71,7 @@ hiddenimports = [
     'ui.utils.theme',
     'ui.utils.env_manager',
     'ui.utils.excel_handler',
+    'ui.utils._version',
     'ui.utils.updater',
     'ui.utils.icons',
     'ui.utils.tooltip',
@@ -119,6 +120,9 @@ a = Analysis(
 pyz = PYZ(a.pure)
 
 # Configuración del ejecutable
+# Build onedir (exclude_binaries=True + COLLECT): no usar onefile, que
+# extrae todo a un _MEI temporal en cada arranque. En onedir PyInstaller
+# también define sys._MEIPASS (carpeta _internal), que usa get_resource_path.
 exe = EXE(
     pyz,
     a.scripts,
@@ -10,6 +10,7 @@ Este script configura los paths necesarios y ejecuta la aplicación
 de escritorio para consultar precios de hoteles.
 """
 
+import importlib.util
 import logging
 import sys
 from pathlib import Path
@@ -41,20 +42,18 @@ def verificar_dependencias() -> bool:
 
     Returns:
         True si todas las dependencias están disponibles.
-
-    Raises:
-        ImportError: Si falta alguna dependencia crítica.
     """
     dependencias_faltantes = []
 
+    # Import real: también detecta instalaciones rotas (p. ej. sin _tkinter)
     try:
         import customtkinter
     except ImportError:
         dependencias_faltantes.append("customtkinter")
 
-    try:
-        import packaging
-    except ImportError:
+    # find_spec solo localiza el módulo: packaging lo importa el updater
+    # en su hilo, fuera del arranque
+    if importlib.util.find_spec("packaging") is None:
         dependencias_faltantes.append("packaging")
 
     if dependencias_faltantes:
@@ -7,6 +7,8 @@ from __future__ import annotations
 import json
 import logging
 import os
+import zipfile
+from xml.etree import ElementTree
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 import requests
@@ -15,6 +17,14 @@ from flask.wrappers import Response
 
 import config
 
+# Optional Rust-based reader for the Excel read path (openpyxl fallback)
+try:
+    from python_calamine import CalamineWorkbook
+    CALAMINE_AVAILABLE = True
+except ImportError:
+    CalamineWorkbook = None
+    CALAMINE_AVAILABLE = False
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -59,10 +69,38 @@ def save_mapping(mapping: Dict[str, str]) -> None:
         json.dump(mapping, f, indent=4, ensure_ascii=False)
 
 
+_SPREADSHEET_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+
+
+def _active_sheet_index(path: str) -> int:
+    """
+    Index of the workbook's active tab, as openpyxl's ``wb.active`` picks it.
+
+    python-calamine only opens sheets by index or name, so the
+    ``activeTab`` of the first workbook view is read from xl/workbook.xml.
+    """
+    with zipfile.ZipFile(path) as zf:
+        root = ElementTree.fromstring(zf.read("xl/workbook.xml"))
+    view = root.find(f"{_SPREADSHEET_NS}bookViews/{_SPREADSHEET_NS}workbookView")
+    if view is None:
+        return 0
+    return int(view.get("activeTab", 0))
+
+
+def _cell_text(value: Any) -> str:
+    """Stringify a cell like openpyxl would (calamine returns 123 as 123.0)."""
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value).strip()
+
+
 def get_excel_hotels() -> List[str]:
     """
     Get list of hotel names from Excel file.
 
+    Uses python-calamine when installed, otherwise openpyxl in
+    read-only mode.
+
     Returns:
         Sorted list of unique hotel names
     """
@@ -70,17 +108,29 @@ def get_excel_hotels() -> List[str]:
         return []
 
     try:
-        import openpyxl
-        wb = openpyxl.load_workbook(EXCEL_FILE, data_only=True)
-        ws = wb.active
-        hotels: List[str] = []
-
-        for row in range(2, ws.max_row + 1):
-            name = ws.cell(row=row, column=1).value
-            if name:
-                hotels.append(str(name).strip())
-
-        return sorted(list(set(hotels)))
+        if CALAMINE_AVAILABLE:
+            sheet = CalamineWorkbook.from_path(EXCEL_FILE).get_sheet_by_index(
+                _active_sheet_index(EXCEL_FILE)
+            )
+            # Keep leading blank rows/columns so rows[1:] and row[0] line up
+            # with openpyxl's min_row=2, column A
+            rows = sheet.to_python(skip_empty_area=False)
+            hotels = {_cell_text(row[0]) for row in rows[1:] if row and row[0]}
+        else:
+            import openpyxl
+            wb = openpyxl.load_workbook(EXCEL_FILE, read_only=True, data_only=True)
+            try:
+                hotels = {
+                    str(name).strip()
+                    for (name,) in wb.active.iter_rows(
+                        min_row=2, max_col=1, values_only=True
+                    )
+                    if name
+                }
+            finally:
+                wb.close()
+
+        return sorted(hotels)
     except (OSError, Exception) as e:
         logger.error("Failed to read Excel file: %s", e)
         return []
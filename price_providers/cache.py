@@ -6,17 +6,53 @@ to reduce API calls on subsequent runs.
 """
 from __future__ import annotations
 
+import heapq
 import json
 import logging
 import os
+import sys
+import time
+from collections import Counter
+from contextlib import contextmanager
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Callable, Iterator, List, Optional, Union
 
 from .base import PriceResult
 
+# Optional fast JSON backend; both branches produce compact UTF-8 bytes
+try:
+    import orjson
+
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj: object) -> bytes:
+        return json.dumps(
+            obj, ensure_ascii=False, separators=(',', ':')
+        ).encode('utf-8')
+
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
 
+KEY_SEP = "||"
+
+# When full, evict down to this fraction of max_entries in one pass, so
+# the O(N) ranking is paid once per batch rather than on every set()
+EVICT_TO_FRACTION = 0.9
+
+
+def _make_key(hotel_name: str, check_in: str) -> str:
+    """Build the flat cache key for a hotel/date pair."""
+    return f"{hotel_name}{KEY_SEP}{check_in}"
+
+
+def _hotel_from_key(key: str) -> str:
+    """Recover the hotel name from a flat cache key."""
+    return key.rsplit(KEY_SEP, 1)[0]
+
+
 class PriceCache:
     """
     File-based cache for hotel prices with TTL support.
@@ -24,23 +60,27 @@ class PriceCache:
     Stores prices in a JSON file with timestamps, automatically
     expiring entries after the configured TTL.
 
-    Cache structure:
+    Cache structure (flat, one entry per hotel/date pair):
     {
-        "Hotel Name": {
-            "2026-03-01": {
-                "price": 150.0,
-                "provider": "Booking.com",
-                "source": "serpapi",
-                "timestamp": "2026-02-03T10:30:00"
-            }
+        "Hotel Name||2026-03-01": {
+            "price": 150.0,
+            "provider": "Booking.com",
+            "source": "serpapi",
+            "timestamp": 1770114600.0
         }
     }
+
+    Timestamps are epoch seconds. Files written in the older nested
+    layout ({hotel: {date: entry}}, ISO timestamps) are flattened on
+    load and their ISO timestamps are still honoured.
     """
 
     def __init__(
         self,
         cache_file: str = "cache/prices_cache.json",
-        ttl_hours: int = 24
+        ttl_hours: int = 24,
+        max_entries: int = 10000,
+        clock: Callable[[], float] = time.time
     ) -> None:
         """
         Initialize the price cache.
@@ -48,54 +88,167 @@ class PriceCache:
         Args:
             cache_file: Path to the cache JSON file
             ttl_hours: Time To Live in hours (default: 24h)
+            max_entries: Maximum number of hotel/date entries kept; when
+                full, the cache is trimmed to EVICT_TO_FRACTION of it,
+                expired entries first, then the least frequently read
+            clock: Returns the current time in epoch seconds (tests
+                can pass a fixed clock)
         """
         self.cache_file = cache_file
+        self._clock = clock
         self.ttl = timedelta(hours=ttl_hours)
+        self._ttl_seconds = self.ttl.total_seconds()
+        self.max_entries = max_entries
+        # Reads per key this session, used to pick eviction victims
+        self._hits: Counter = Counter()
         self._cache: dict = {}
+        # Hotels with at least one entry, so misses skip building a key
+        self._known_hotels: set = set()
+        self._dirty = False
+        self._buffered = False
+        # Bytes of the last payload read or written, to skip no-op saves
+        self._saved_payload: Optional[bytes] = None
         self._load_cache()
 
     def _load_cache(self) -> None:
         """Load cache from file if it exists."""
-        if os.path.exists(self.cache_file):
+        self._cache = {}
+        try:
+            # One sized read of the whole file, parsed from bytes
+            with open(self.cache_file, 'rb') as f:
+                raw = f.read()
+        except FileNotFoundError:
+            raw = None
+        except OSError as e:
+            logger.warning("Failed to load cache: %s", e)
+            raw = None
+
+        if raw:
             try:
-                with open(self.cache_file, 'r', encoding='utf-8') as f:
-                    self._cache = json.load(f)
-                logger.debug("Loaded %d hotels from cache", len(self._cache))
-            except (json.JSONDecodeError, OSError) as e:
+                self._cache = self._flatten_legacy(_json_loads(raw))
+                self._intern_labels()
+                self._saved_payload = raw
+                logger.debug("Loaded %d entries from cache", len(self._cache))
+            except ValueError as e:
                 logger.warning("Failed to load cache: %s", e)
                 self._cache = {}
-        else:
-            self._cache = {}
+        self._reindex()
+
+    def _reindex(self) -> None:
+        """Rebuild the set of known hotels from the cache keys."""
+        self._known_hotels = {_hotel_from_key(key) for key in self._cache}
+
+    def _intern_labels(self) -> None:
+        """Share one string object per provider/source label."""
+        for entry in self._cache.values():
+            for field in ("provider", "source"):
+                value = entry.get(field)
+                if isinstance(value, str):
+                    entry[field] = sys.intern(value)
+
+    @staticmethod
+    def _flatten_legacy(data: dict) -> dict:
+        """
+        Convert a nested {hotel: {date: entry}} cache to the flat layout.
+
+        Flat entries (which carry a "price" field) are kept as they are.
+        """
+        flat = {}
+        for key, value in data.items():
+            if not isinstance(value, dict):
+                continue
+            if "price" in value:
+                flat[key] = value
+            else:
+                for check_in, entry in value.items():
+                    flat[_make_key(key, check_in)] = entry
+        return flat
 
     def _save_cache(self) -> None:
-        """Save cache to file."""
+        """Save cache to file, skipping the write if nothing changed."""
+        # Serialize up front so the file gets a single write instead of
+        # one small write per JSON token
+        payload = _json_dumps(self._cache)
+        if payload == self._saved_payload:
+            self._dirty = False
+            return
+
         # Ensure directory exists
         cache_dir = os.path.dirname(self.cache_file)
         if cache_dir and not os.path.exists(cache_dir):
             os.makedirs(cache_dir, exist_ok=True)
 
+        # Write a sibling temp file and rename it over the cache, so a
+        # crash mid-write never leaves a truncated cache behind
+        tmp_file = self.cache_file + '.tmp'
         try:
-            with open(self.cache_file, 'w', encoding='utf-8') as f:
-                json.dump(self._cache, f, indent=2, ensure_ascii=False)
+            with open(tmp_file, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_file, self.cache_file)
+            self._dirty = False
+            self._saved_payload = payload
         except OSError as e:
             logger.error("Failed to save cache: %s", e)
+            try:
+                os.remove(tmp_file)
+            except OSError:
+                pass
+
+    def _persist(self) -> None:
+        """Mark the cache as modified and save unless writes are buffered."""
+        self._dirty = True
+        if not self._buffered:
+            self._save_cache()
+
+    @contextmanager
+    def buffered(self) -> Iterator["PriceCache"]:
+        """
+        Defer saving to disk until the block exits.
 
-    def _is_expired(self, timestamp_str: str) -> bool:
+        Mutations inside the block only update memory; a single save
+        happens on exit if anything changed. Nested blocks save once,
+        when the outermost one exits.
+
+        Example:
+            with cache.buffered():
+                for hotel in hotels:
+                    cache.set(hotel, check_in, result)
+        """
+        previous = self._buffered
+        self._buffered = True
+        try:
+            yield self
+        finally:
+            self._buffered = previous
+            if not previous and self._dirty:
+                self._save_cache()
+
+    def _is_expired(
+        self,
+        timestamp: Union[float, str, None],
+        now: Optional[float] = None
+    ) -> bool:
         """
         Check if a timestamp is expired based on TTL.
 
         Args:
-            timestamp_str: ISO format timestamp
+            timestamp: Epoch seconds (ISO strings from older cache
+                files are also accepted)
+            now: Reference time in epoch seconds (defaults to
+                the cache clock); pass one value when checking many entries
 
         Returns:
             True if expired, False otherwise
         """
+        if now is None:
+            now = self._clock()
+        if isinstance(timestamp, (int, float)):
+            return now - timestamp > self._ttl_seconds
         try:
-            timestamp = datetime.fromisoformat(timestamp_str)
-            age = datetime.now() - timestamp
-            return age > self.ttl
+            stamp = datetime.fromisoformat(timestamp).timestamp()
         except (ValueError, TypeError):
             return True
+        return now - stamp > self._ttl_seconds
 
     def get(
         self,
@@ -112,11 +265,11 @@ class PriceCache:
         Returns:
             PriceResult with cached=True if found and not expired, None otherwise
         """
-        hotel_cache = self._cache.get(hotel_name)
-        if not hotel_cache:
+        if hotel_name not in self._known_hotels:
             return None
 
-        date_cache = hotel_cache.get(check_in)
+        key = _make_key(hotel_name, check_in)
+        date_cache = self._cache.get(key)
         if not date_cache:
             return None
 
@@ -126,12 +279,16 @@ class PriceCache:
             logger.debug("Cache expired for %s on %s", hotel_name, check_in)
             return None
 
-        return PriceResult(
-            price=date_cache["price"],
-            provider=date_cache["provider"],
-            source=date_cache["source"],
-            cached=True
-        )
+        self._hits[key] += 1
+        # Annotated literal: calling the TypedDict class costs ~3x a
+        # plain dict display and this runs on every cache hit
+        result: PriceResult = {
+            "price": date_cache["price"],
+            "provider": date_cache["provider"],
+            "source": date_cache["source"],
+            "cached": True
+        }
+        return result
 
     def set(
         self,
@@ -142,51 +299,110 @@ class PriceCache:
         """
         Cache a price result.
 
+        Re-caching the same price, provider and source for an entry that
+        is still fresh refreshes its timestamp in memory only: the file is
+        not rewritten for it, so the on-disk timestamp is updated with the
+        next save that has a real change.
+
         Args:
             hotel_name: Hotel name
             check_in: Check-in date (YYYY-MM-DD)
             result: PriceResult to cache
         """
-        if hotel_name not in self._cache:
-            self._cache[hotel_name] = {}
-
-        self._cache[hotel_name][check_in] = {
+        key = _make_key(hotel_name, check_in)
+        entry = self._cache.get(key)
+        if (
+            entry is not None
+            and entry.get("price") == result["price"]
+            and entry.get("provider") == result["provider"]
+            and entry.get("source") == result["source"]
+            and not self._is_expired(entry.get("timestamp"))
+        ):
+            # Same fresh value: extend its TTL in memory but skip the write
+            entry["timestamp"] = self._clock()
+            return
+
+        if entry is None and len(self._cache) >= self.max_entries:
+            self._evict_batch()
+
+        self._known_hotels.add(hotel_name)
+        self._cache[key] = {
             "price": result["price"],
-            "provider": result["provider"],
-            "source": result["source"],
-            "timestamp": datetime.now().isoformat()
+            # A handful of labels repeat across every entry
+            "provider": sys.intern(result["provider"]),
+            "source": sys.intern(result["source"]),
+            "timestamp": self._clock()
         }
 
-        self._save_cache()
+        self._persist()
 
-    def clear_expired(self) -> int:
+    def _evict_batch(self) -> None:
         """
-        Remove all expired entries from cache.
+        Trim the cache to EVICT_TO_FRACTION of max_entries in one pass.
 
-        Returns:
-            Number of entries removed
+        Expired entries go first; otherwise the entries with the fewest
+        reads this session are removed, oldest first on ties. Always
+        frees at least one slot.
         """
-        removed = 0
-        hotels_to_remove = []
+        target = min(self.max_entries - 1, int(self.max_entries * EVICT_TO_FRACTION))
+        count = len(self._cache) - max(target, 0)
+        if count <= 0:
+            return
+
+        now = self._clock()
+
+        def rank(key: str) -> tuple:
+            timestamp = self._cache[key].get("timestamp")
+            stamp = timestamp if isinstance(timestamp, (int, float)) else 0.0
+            return (not self._is_expired(timestamp, now), self._hits[key], stamp)
+
+        victims = heapq.nsmallest(count, self._cache, key=rank)
+        for key in victims:
+            del self._cache[key]
+            self._hits.pop(key, None)
+        self._reindex()
+        logger.debug("Evicted %d cache entries", len(victims))
+
+    def _expired_keys(self) -> List[str]:
+        """
+        Classify every entry against one cutoff in a single pass.
 
-        for hotel_name, hotel_cache in self._cache.items():
-            dates_to_remove = []
-            for check_in, data in hotel_cache.items():
-                if self._is_expired(data.get("timestamp", "")):
-                    dates_to_remove.append(check_in)
-                    removed += 1
+        Epoch timestamps need only a float compare against
+        now - TTL; anything else (ISO strings from older files,
+        missing values) goes through _is_expired().
 
-            for date in dates_to_remove:
-                del hotel_cache[date]
+        Returns:
+            Keys of expired entries
+        """
+        now = self._clock()
+        cutoff = now - self._ttl_seconds
+        expired = []
+        for key, data in self._cache.items():
+            timestamp = data.get("timestamp")
+            if isinstance(timestamp, (int, float)):
+                if timestamp < cutoff:
+                    expired.append(key)
+            elif self._is_expired(timestamp, now):
+                expired.append(key)
+        return expired
 
-            if not hotel_cache:
-                hotels_to_remove.append(hotel_name)
+    def clear_expired(self) -> int:
+        """
+        Remove all expired entries from cache.
 
-        for hotel in hotels_to_remove:
-            del self._cache[hotel]
+        Returns:
+            Number of entries removed
+        """
+        expired = self._expired_keys()
+        for key in expired:
+            del self._cache[key]
+            self._hits.pop(key, None)
+        removed = len(expired)
+        if removed:
+            self._reindex()
 
         if removed > 0:
-            self._save_cache()
+            self._persist()
             logger.info("Cleared %d expired cache entries", removed)
 
         return removed
@@ -194,7 +410,9 @@ class PriceCache:
     def clear_all(self) -> None:
         """Clear entire cache."""
         self._cache = {}
-        self._save_cache()
+        self._known_hotels = set()
+        self._hits.clear()
+        self._persist()
         logger.info("Cache cleared")
 
     def get_stats(self) -> dict:
@@ -204,17 +422,12 @@ class PriceCache:
         Returns:
             Dict with total_hotels, total_entries, expired_entries
         """
-        total_entries = 0
-        expired_entries = 0
-
-        for hotel_cache in self._cache.values():
-            for data in hotel_cache.values():
-                total_entries += 1
-                if self._is_expired(data.get("timestamp", "")):
-                    expired_entries += 1
+        total_entries = len(self._cache)
+        expired_entries = len(self._expired_keys())
+        hotels = {_hotel_from_key(key) for key in self._cache}
 
         return {
-            "total_hotels": len(self._cache),
+            "total_hotels": len(hotels),
             "total_entries": total_entries,
             "expired_entries": expired_entries,
             "valid_entries": total_entries - expired_entries
@@ -8,7 +8,7 @@ from __future__ import annotations
 
 import logging
 from collections import defaultdict
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from .base import PriceProvider, PriceResult
 from .cache import PriceCache
@@ -45,7 +45,27 @@ class CascadePriceProvider:
         self.providers = providers
         self.cache = cache or PriceCache()
         self.stats: Dict[str, int] = defaultdict(int)
+        self._live: Tuple[Tuple[PriceProvider, str], ...] = ()
         self._reset_stats()
+        self.refresh_providers()
+
+    def refresh_providers(self) -> None:
+        """
+        Recompute which providers get_price() will try.
+
+        Availability depends on installed packages and configured
+        credentials, so it is checked once here rather than per hotel.
+        Call this again after changing self.providers or a provider's
+        configuration.
+        """
+        live = []
+        for provider in self.providers:
+            name = provider.get_name()
+            if provider.is_available():
+                live.append((provider, name))
+            else:
+                logger.debug("Skipping %s (not available)", name)
+        self._live = tuple(live)
 
     def _reset_stats(self) -> None:
         """Reset statistics counters."""
@@ -89,16 +109,9 @@ class CascadePriceProvider:
             logger.debug("[%s] Found in cache: $%.2f", hotel_name, cached["price"])
             return cached
 
-        # 2. Try each provider in order
-        for provider in self.providers:
-            if not provider.is_available():
-                logger.debug(
-                    "[%s] Skipping %s (not available)",
-                    hotel_name, provider.get_name()
-                )
-                continue
-
-            logger.debug("[%s] Trying %s...", hotel_name, provider.get_name())
+        # 2. Try each available provider in order
+        for provider, name in self._live:
+            logger.debug("[%s] Trying %s...", hotel_name, name)
 
             result = provider.get_price(
                 hotel_name, hotel_key, check_in, check_out, rooms, adults,
@@ -108,12 +121,12 @@ class CascadePriceProvider:
             if result:
                 # Cache the result
                 self.cache.set(hotel_name, check_in, result)
-                self.stats[provider.get_name()] += 1
+                self.stats[name] += 1
 
                 logger.info(
                     "[%s] Found: $%.2f via %s (%s)",
                     hotel_name, result["price"],
-                    result["provider"], provider.get_name()
+                    result["provider"], name
                 )
                 return result
 
@@ -142,36 +155,31 @@ class CascadePriceProvider:
         if total == 0:
             return "No hotels processed"
 
+        # total > 0 from here on, so percentages share one scale factor
+        scale = 100.0 / total
+        stats = self.stats
+        found = total - stats["not_found"]
+        cache_count = stats["cache"]
+        not_found = stats["not_found"]
+
         lines = [
             f"[STATS] Hotels processed: {total}",
-            "[STATS] Prices by source:"
+            "[STATS] Prices by source:",
+            f"   Cache:      {cache_count:3d} ({cache_count * scale:.1f}%)",
         ]
 
-        # Calculate found total
-        found = total - self.stats["not_found"]
-
-        # Add cache stats
-        cache_count = self.stats["cache"]
-        cache_pct = (cache_count / total * 100) if total > 0 else 0
-        lines.append(f"   Cache:      {cache_count:3d} ({cache_pct:.1f}%)")
-
-        # Add provider stats
+        # Provider rows: capitalized and padded name for alignment
         for provider in self.providers:
             name = provider.get_name()
-            count = self.stats.get(name, 0)
-            pct = (count / total * 100) if total > 0 else 0
-            # Capitalize and pad name for alignment
-            display_name = name.capitalize()
-            lines.append(f"   {display_name:10s} {count:3d} ({pct:.1f}%)")
-
-        # Add not found stats
-        not_found = self.stats["not_found"]
-        not_found_pct = (not_found / total * 100) if total > 0 else 0
-        lines.append(f"   NOT FOUND:  {not_found:3d} ({not_found_pct:.1f}%)")
+            count = stats.get(name, 0)
+            lines.append(
+                f"   {name.capitalize():10s} {count:3d} ({count * scale:.1f}%)"
+            )
 
-        # Add coverage summary
-        coverage_pct = (found / total * 100) if total > 0 else 0
-        lines.append(f"[STATS] TOTAL COVERAGE: {found}/{total} ({coverage_pct:.1f}%)")
+        lines.append(f"   NOT FOUND:  {not_found:3d} ({not_found * scale:.1f}%)")
+        lines.append(
+            f"[STATS] TOTAL COVERAGE: {found}/{total} ({found * scale:.1f}%)"
+        )
 
         return "\n".join(lines)
 
@@ -186,4 +194,4 @@ class CascadePriceProvider:
         Returns:
             List of provider names that are available
         """
-        return [p.get_name() for p in self.providers if p.is_available()]
+        return [name for _, name in self._live]
@@ -6,6 +6,7 @@ Free tier: 250 searches/month.
 """
 from __future__ import annotations
 
+import json
 import logging
 import os
 from typing import Optional
@@ -22,6 +23,13 @@ except ImportError:
     SERPAPI_AVAILABLE = False
     GoogleSearch = None
 
+# Google Hotels responses run to hundreds of KB; prefer orjson when installed
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 
 class SerpApiProvider(PriceProvider):
     """
@@ -81,11 +89,14 @@ class SerpApiProvider(PriceProvider):
                 "check_out_date": check_out,
                 "adults": adults,
                 "currency": "USD",
+                "output": "json",
                 "api_key": self.api_key
             }
 
+            # Parse the raw body ourselves instead of get_dict(), which
+            # goes through stdlib json and then copies the result
             search = GoogleSearch(params)
-            results = search.get_dict()
+            results = _json_loads(search.get_results())
 
             # Check for errors
             if "error" in results:
@@ -139,23 +150,29 @@ class SerpApiProvider(PriceProvider):
         Returns:
             Best matching property dict, or None
         """
-        hotel_name_lower = hotel_name.lower()
+        hotel_name_cf = hotel_name.casefold()
+        # Normalize every property name once; both passes reuse the list
+        prop_names = [prop.get("name", "").casefold() for prop in properties]
+
+        # Exact name: a single C-level list scan, and it wins over a partial
+        # match that happens to appear earlier in the results
+        try:
+            return properties[prop_names.index(hotel_name_cf)]
+        except ValueError:
+            pass
 
-        # First pass: exact or very close match
-        for prop in properties:
-            prop_name = prop.get("name", "").lower()
-            if hotel_name_lower in prop_name or prop_name in hotel_name_lower:
+        # First pass: very close match (one name contains the other)
+        for prop, prop_name in zip(properties, prop_names):
+            if hotel_name_cf in prop_name or prop_name in hotel_name_cf:
                 return prop
 
         # Second pass: word overlap
-        hotel_words = set(hotel_name_lower.split())
+        hotel_words = frozenset(hotel_name_cf.split())
         best_score = 0
         best_prop = None
 
-        for prop in properties:
-            prop_name = prop.get("name", "").lower()
-            prop_words = set(prop_name.split())
-            overlap = len(hotel_words & prop_words)
+        for prop, prop_name in zip(properties, prop_names):
+            overlap = len(hotel_words.intersection(prop_name.split()))
 
             if overlap > best_score:
                 best_score = overlap
@@ -7,16 +7,13 @@ that aggregates prices from TripAdvisor.
 from __future__ import annotations
 
 import logging
-from typing import List, Optional
+import time
+from typing import Dict, List, Optional, Tuple
 
-from .base import PriceProvider, PriceResult
-
-# Import from parent directory
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from xotelo_api import XoteloAPI, get_client
 
+from .base import PriceProvider, PriceResult
+
 logger = logging.getLogger(__name__)
 
 
@@ -29,6 +26,9 @@ class XoteloProvider(PriceProvider):
     mapped in hotel_keys_db.json.
     """
 
+    # Seconds to remember that a (key, dates, occupancy) lookup had no rates
+    NEGATIVE_CACHE_TTL: float = 60.0
+
     def __init__(self, api: Optional[XoteloAPI] = None) -> None:
         """
         Initialize the Xotelo provider.
@@ -38,6 +38,8 @@ class XoteloProvider(PriceProvider):
         """
         self.api = api or get_client()
         self._multi_date_ranges: Optional[List[dict]] = None
+        # (hotel_key, chk_in, chk_out, rooms, adults) -> time of the empty lookup
+        self._negative_cache: Dict[Tuple[str, str, str, int, int], float] = {}
 
     def set_multi_date_ranges(self, date_ranges: List[dict]) -> None:
         """
@@ -120,13 +122,21 @@ class XoteloProvider(PriceProvider):
             return None
 
         for date_range in self._multi_date_ranges:
-            rate_data = self.api.get_rates(
+            lookup = (
                 hotel_key,
                 date_range['chk_in'],
                 date_range['chk_out'],
                 rooms,
                 adults
             )
+            missed_at = self._negative_cache.get(lookup)
+            if missed_at is not None:
+                if time.monotonic() - missed_at < self.NEGATIVE_CACHE_TTL:
+                    # Known miss: skip the request and the rate-limit wait
+                    continue
+                del self._negative_cache[lookup]
+
+            rate_data = self.api.get_rates(*lookup)
             if rate_data:
                 logger.debug(
                     "Xotelo: Found price via %s date range",
@@ -138,6 +148,7 @@ class XoteloProvider(PriceProvider):
                     source=f"xotelo:{date_range['label']}",
                     cached=False
                 )
+            self._negative_cache[lookup] = time.monotonic()
             self.api.wait()
 
         return None
@@ -0,0 +1,167 @@
+"""
+Shared pytest fixtures.
+
+The project root is put on sys.path by ``pythonpath`` in pytest.ini.
+Project and HTTP modules are imported inside the fixtures that need them,
+so a filtered run (e.g. ``-m "not providers"``) only pays for what it uses.
+"""
+import time
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+
+class InMemoryCache:
+    """Dict-backed stand-in for PriceCache that never touches disk."""
+
+    def __init__(self):
+        self.store = {}
+
+    def get(self, hotel_name, check_in):
+        return self.store.get((hotel_name, check_in))
+
+    def set(self, hotel_name, check_in, result):
+        self.store[(hotel_name, check_in)] = result
+
+
+class FrozenDatetime(datetime):
+    """datetime whose now() is pinned to 2026-02-01 12:00 (freezegun-free)."""
+
+    @classmethod
+    def now(cls, tz=None):
+        return cls(2026, 2, 1, 12, 0, 0, tzinfo=tz)
+
+
+class FakeResponse:
+    """Minimal requests.Response stand-in: a JSON body and a no-op status check."""
+
+    __slots__ = ("_json",)
+
+    def __init__(self, data):
+        self._json = data
+
+    def json(self):
+        return self._json
+
+    def raise_for_status(self):
+        pass
+
+
+class RecordingWorksheet:
+    """Worksheet stand-in that records the keyword args of ws.cell() calls."""
+
+    def __init__(self):
+        self.calls = []
+
+    def cell(self, **kwargs):
+        self.calls.append(kwargs)
+
+    def assert_cell_called(self, **kwargs):
+        assert kwargs in self.calls, f"cell({kwargs}) not in {self.calls}"
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(request, monkeypatch):
+    """Make time.sleep a no-op mock for every test except the live smoke tests.
+
+    Retry back-off and XoteloAPI.wait() would otherwise really sleep. Tests
+    that care about the delay take this fixture and assert on the mock.
+    """
+    if request.node.get_closest_marker("smoke"):
+        return None
+    mock = MagicMock()
+    monkeypatch.setattr(time, "sleep", mock)
+    return mock
+
+
+@pytest.fixture(scope="session")
+def frozen_datetime():
+    """FrozenDatetime class, to monkeypatch over a module's ``datetime``."""
+    return FrozenDatetime
+
+
+@pytest.fixture
+def memory_cache():
+    """Empty in-memory price cache."""
+    return InMemoryCache()
+
+
+@pytest.fixture(scope="class")
+def tmpdir_cls(tmp_path_factory):
+    """Temporary directory shared by every test in a class."""
+    return str(tmp_path_factory.mktemp("cache"))
+
+
+@pytest.fixture(scope="module")
+def default_api():
+    """One default-config XoteloAPI per module (patch methods on the class)."""
+    from xotelo_api import XoteloAPI
+
+    return XoteloAPI()
+
+
+@pytest.fixture
+def mock_api():
+    """Fresh XoteloAPI mock restricted to the real client's attributes."""
+    from xotelo_api import XoteloAPI
+
+    return MagicMock(spec=XoteloAPI)
+
+
+def _mock_method(monkeypatch, owner, name):
+    """Replace owner.name with a fresh MagicMock for the current test."""
+    mock = MagicMock()
+    monkeypatch.setattr(owner, name, mock)
+    return mock
+
+
+@pytest.fixture
+def mock_request(monkeypatch):
+    """XoteloAPI._request replaced by a mock (called as (endpoint, params))."""
+    from xotelo_api import XoteloAPI
+
+    return _mock_method(monkeypatch, XoteloAPI, "_request")
+
+
+@pytest.fixture
+def mock_get_rates(monkeypatch):
+    """XoteloAPI.get_rates replaced by a mock."""
+    from xotelo_api import XoteloAPI
+
+    return _mock_method(monkeypatch, XoteloAPI, "get_rates")
+
+
+@pytest.fixture
+def mock_session_get(monkeypatch):
+    """requests.Session.get replaced by a mock, so no socket is opened."""
+    import requests
+
+    return _mock_method(monkeypatch, requests.Session, "get")
+
+
+@pytest.fixture
+def fake_response():
+    """Factory for slotted Response stubs: fake_response({'result': ...})."""
+    return FakeResponse
+
+
+@pytest.fixture
+def recording_ws():
+    """Empty worksheet stub that records cell writes."""
+    return RecordingWorksheet()
+
+
+@pytest.fixture(scope="session")
+def sample_hotel():
+    """Canonical extracted hotel record (treat as read-only)."""
+    import extract_all_hotels as extractor
+
+    return extractor.HotelData(
+        name='Test Hotel',
+        key='test-key',
+        url='https://example.com',
+        accommodation_type='hotel',
+        rating=4.0,
+        review_count=50
+    )
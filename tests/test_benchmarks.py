@@ -0,0 +1,62 @@
+"""
+Throughput benchmarks for the extractor and its savers.
+Scenarios are parameterized by the number of hotels so regressions in the
+write-only Excel path or the JSON writer show up as a change in scaling.
+
+Run with: RUN_BENCHMARKS=1 pytest tests/test_benchmarks.py -m perf
+Requires pytest-benchmark (see requirements-dev.txt).
+"""
+import os
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+import extract_all_hotels as extractor
+
+pytestmark = [
+    pytest.mark.perf,
+    pytest.mark.skipif(
+        os.getenv("RUN_BENCHMARKS") != "1",
+        reason="Set RUN_BENCHMARKS=1 to run benchmarks"
+    ),
+]
+
+SIZES = [100, 1_000, 10_000]
+
+
+def _raw_hotels(n):
+    return [
+        {'name': f'H{i}', 'key': f'k{i}', 'url': '', 'accommodation_type': 'hotel',
+         'review_summary': {'rating': 4.0, 'count': i}}
+        for i in range(n)
+    ]
+
+
+@pytest.mark.parametrize("n", SIZES)
+def test_bench_extract(benchmark, n):
+    raw = _raw_hotels(n)
+
+    result = benchmark(extractor.extract_hotel_data, raw)
+
+    assert len(result) == n
+
+
+@pytest.mark.parametrize("n", SIZES)
+def test_bench_save_json(benchmark, tmp_path, n):
+    hotels = extractor.extract_hotel_data(_raw_hotels(n))
+    filename = str(tmp_path / "bench.json")
+
+    benchmark(extractor.save_to_json, hotels, filename)
+
+    assert os.path.getsize(filename) > 0
+
+
+@pytest.mark.parametrize("n", SIZES)
+def test_bench_save_excel(benchmark, tmp_path, n):
+    hotels = extractor.extract_hotel_data(_raw_hotels(n))
+    filename = str(tmp_path / "bench.xlsx")
+
+    benchmark(extractor.save_to_excel, hotels, filename)
+
+    assert os.path.getsize(filename) > 0
@@ -6,271 +6,499 @@ Tests caching logic, TTL expiration, and persistence.
 import pytest
 from unittest.mock import patch, mock_open
 import os
-import sys
 import json
-import tempfile
 from datetime import datetime, timedelta
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from price_providers.cache import PriceCache
 from price_providers.base import PriceResult
 
 
+# Fixed epoch time for tests that inject a clock
+NOW = 1_780_000_000.0
+
+
+@pytest.fixture
+def cache_file(tmpdir_cls, request):
+    """Per-test cache path inside the shared class directory."""
+    return os.path.join(tmpdir_cls, f"{request.node.name}.json")
+
+
 class TestPriceCache:
     """Tests for PriceCache."""
 
-    def test_init_creates_empty_cache(self):
+    def test_init_creates_empty_cache(self, cache_file):
         """Test that init creates empty cache when file doesn't exist."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            cache_file = os.path.join(tmpdir, "cache.json")
-            cache = PriceCache(cache_file=cache_file, ttl_hours=24)
+        cache = PriceCache(cache_file=cache_file, ttl_hours=24)
 
-            assert cache._cache == {}
+        assert cache._cache == {}
 
-    def test_set_and_get(self):
+    def test_set_and_get(self, cache_file):
         """Test basic set and get operations."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            cache_file = os.path.join(tmpdir, "cache.json")
-            cache = PriceCache(cache_file=cache_file, ttl_hours=24)
+        cache = PriceCache(cache_file=cache_file, ttl_hours=24)
 
-            result: PriceResult = {
-                "price": 150.0,
-                "provider": "Booking.com",
-                "source": "serpapi",
-                "cached": False
-            }
+        result: PriceResult = {
+            "price": 150.0,
+            "provider": "Booking.com",
+            "source": "serpapi",
+            "cached": False
+        }
 
-            cache.set("Test Hotel", "2026-03-01", result)
-            retrieved = cache.get("Test Hotel", "2026-03-01")
+        cache.set("Test Hotel", "2026-03-01", result)
+        retrieved = cache.get("Test Hotel", "2026-03-01")
 
-            assert retrieved is not None
-            assert retrieved["price"] == 150.0
-            assert retrieved["provider"] == "Booking.com"
-            assert retrieved["source"] == "serpapi"
-            assert retrieved["cached"] is True  # Should be marked as cached
+        assert retrieved is not None
+        assert retrieved["price"] == 150.0
+        assert retrieved["provider"] == "Booking.com"
+        assert retrieved["source"] == "serpapi"
+        assert retrieved["cached"] is True  # Should be marked as cached
 
-    def test_get_nonexistent_hotel(self):
+    def test_get_nonexistent_hotel(self, cache_file):
         """Test get returns None for non-existent hotel."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            cache_file = os.path.join(tmpdir, "cache.json")
-            cache = PriceCache(cache_file=cache_file, ttl_hours=24)
+        cache = PriceCache(cache_file=cache_file, ttl_hours=24)
 
-            result = cache.get("Nonexistent Hotel", "2026-03-01")
-            assert result is None
+        result = cache.get("Nonexistent Hotel", "2026-03-01")
+        assert result is None
 
-    def test_get_nonexistent_date(self):
+    def test_get_nonexistent_date(self, cache_file):
         """Test get returns None for non-existent date."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            cache_file = os.path.join(tmpdir, "cache.json")
-            cache = PriceCache(cache_file=cache_file, ttl_hours=24)
+        cache = PriceCache(cache_file=cache_file, ttl_hours=24)
 
-            result: PriceResult = {
-                "price": 150.0,
-                "provider": "Test",
-                "source": "test",
-                "cached": False
-            }
-            cache.set("Test Hotel", "2026-03-01", result)
+        result: PriceResult = {
+            "price": 150.0,
+            "provider": "Test",
+            "source": "test",
+            "cached": False
+        }
+        cache.set("Test Hotel", "2026-03-01", result)
 
-            # Different date should return None
-            result = cache.get("Test Hotel", "2026-03-02")
-            assert result is None
+        # Different date should return None
+        result = cache.get("Test Hotel", "2026-03-02")
+        assert result is None
 
-    def test_ttl_expiration(self):
+    def test_ttl_expiration(self, cache_file):
         """Test that expired entries are not returned."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            cache_file = os.path.join(tmpdir, "cache.json")
-            cache = PriceCache(cache_file=cache_file, ttl_hours=1)
-
-            # Manually set an expired entry
-            expired_time = (datetime.now() - timedelta(hours=2)).isoformat()
-            cache._cache = {
-                "Test Hotel": {
-                    "2026-03-01": {
-                        "price": 150.0,
-                        "provider": "Test",
-                        "source": "test",
-                        "timestamp": expired_time
-                    }
-                }
+        cache = PriceCache(cache_file=cache_file, ttl_hours=1, clock=lambda: NOW)
+
+        # Manually set an expired entry
+        expired_time = NOW - 2 * 3600
+        cache._cache = {
+            "Test Hotel||2026-03-01": {
+                "price": 150.0,
+                "provider": "Test",
+                "source": "test",
+                "timestamp": expired_time
             }
+        }
+        cache._reindex()
 
-            result = cache.get("Test Hotel", "2026-03-01")
-            assert result is None
+        result = cache.get("Test Hotel", "2026-03-01")
+        assert result is None
 
-    def test_persistence(self):
+    def test_persistence(self, cache_file):
         """Test that cache persists to file."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            cache_file = os.path.join(tmpdir, "cache.json")
 
-            # Create cache and add entry
-            cache1 = PriceCache(cache_file=cache_file, ttl_hours=24)
-            result: PriceResult = {
-                "price": 200.0,
-                "provider": "Persistent",
-                "source": "test",
-                "cached": False
-            }
-            cache1.set("Persistent Hotel", "2026-03-01", result)
+        # Create cache and add entry
+        cache1 = PriceCache(cache_file=cache_file, ttl_hours=24)
+        result: PriceResult = {
+            "price": 200.0,
+            "provider": "Persistent",
+            "source": "test",
+            "cached": False
+        }
+        cache1.set("Persistent Hotel", "2026-03-01", result)
 
-            # Create new cache instance and verify data
-            cache2 = PriceCache(cache_file=cache_file, ttl_hours=24)
-            retrieved = cache2.get("Persistent Hotel", "2026-03-01")
+        # Create new cache instance and verify data
+        cache2 = PriceCache(cache_file=cache_file, ttl_hours=24)
+        retrieved = cache2.get("Persistent Hotel", "2026-03-01")
 
-            assert retrieved is not None
-            assert retrieved["price"] == 200.0
+        assert retrieved is not None
+        assert retrieved["price"] == 200.0
 
-    def test_clear_expired(self):
+    def test_clear_expired(self, cache_file):
         """Test clearing expired entries."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            cache_file = os.path.join(tmpdir, "cache.json")
-            cache = PriceCache(cache_file=cache_file, ttl_hours=1)
-
-            # Set up cache with mixed entries
-            expired_time = (datetime.now() - timedelta(hours=2)).isoformat()
-            valid_time = datetime.now().isoformat()
-
-            cache._cache = {
-                "Expired Hotel": {
-                    "2026-03-01": {
-                        "price": 100.0,
-                        "provider": "Test",
-                        "source": "test",
-                        "timestamp": expired_time
-                    }
-                },
-                "Valid Hotel": {
-                    "2026-03-01": {
-                        "price": 200.0,
-                        "provider": "Test",
-                        "source": "test",
-                        "timestamp": valid_time
-                    }
-                }
-            }
+        cache = PriceCache(cache_file=cache_file, ttl_hours=1, clock=lambda: NOW)
 
-            removed = cache.clear_expired()
+        # Set up cache with mixed entries
+        expired_time = NOW - 2 * 3600
+        valid_time = NOW
 
-            assert removed == 1
-            assert "Expired Hotel" not in cache._cache
-            assert "Valid Hotel" in cache._cache
-
-    def test_clear_all(self):
-        """Test clearing entire cache."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            cache_file = os.path.join(tmpdir, "cache.json")
-            cache = PriceCache(cache_file=cache_file, ttl_hours=24)
-
-            result: PriceResult = {
+        cache._cache = {
+            "Expired Hotel||2026-03-01": {
                 "price": 100.0,
                 "provider": "Test",
                 "source": "test",
-                "cached": False
+                "timestamp": expired_time
+            },
+            "Valid Hotel||2026-03-01": {
+                "price": 200.0,
+                "provider": "Test",
+                "source": "test",
+                "timestamp": valid_time
             }
-            cache.set("Hotel A", "2026-03-01", result)
-            cache.set("Hotel B", "2026-03-01", result)
+        }
 
-            cache.clear_all()
+        removed = cache.clear_expired()
 
-            assert cache._cache == {}
-            assert cache.get("Hotel A", "2026-03-01") is None
+        assert removed == 1
+        assert "Expired Hotel||2026-03-01" not in cache._cache
+        assert "Valid Hotel||2026-03-01" in cache._cache
+        assert cache._known_hotels == {"Valid Hotel"}
 
-    def test_get_stats(self):
-        """Test statistics calculation."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            cache_file = os.path.join(tmpdir, "cache.json")
-            cache = PriceCache(cache_file=cache_file, ttl_hours=1)
-
-            expired_time = (datetime.now() - timedelta(hours=2)).isoformat()
-            valid_time = datetime.now().isoformat()
-
-            cache._cache = {
-                "Hotel A": {
-                    "2026-03-01": {
-                        "price": 100.0,
-                        "provider": "Test",
-                        "source": "test",
-                        "timestamp": valid_time
-                    },
-                    "2026-03-02": {
-                        "price": 110.0,
-                        "provider": "Test",
-                        "source": "test",
-                        "timestamp": expired_time
-                    }
-                },
-                "Hotel B": {
-                    "2026-03-01": {
-                        "price": 200.0,
-                        "provider": "Test",
-                        "source": "test",
-                        "timestamp": valid_time
-                    }
-                }
-            }
+    def test_clear_all(self, cache_file):
+        """Test clearing entire cache."""
+        cache = PriceCache(cache_file=cache_file, ttl_hours=24)
 
-            stats = cache.get_stats()
+        result: PriceResult = {
+            "price": 100.0,
+            "provider": "Test",
+            "source": "test",
+            "cached": False
+        }
+        cache.set("Hotel A", "2026-03-01", result)
+        cache.set("Hotel B", "2026-03-01", result)
 
-            assert stats["total_hotels"] == 2
-            assert stats["total_entries"] == 3
-            assert stats["expired_entries"] == 1
-            assert stats["valid_entries"] == 2
+        cache.clear_all()
 
-    def test_creates_cache_directory(self):
-        """Test that cache creates parent directory if needed."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            cache_file = os.path.join(tmpdir, "subdir", "cache.json")
-            cache = PriceCache(cache_file=cache_file, ttl_hours=24)
+        assert cache._cache == {}
+        assert cache._known_hotels == set()
+        assert cache.get("Hotel A", "2026-03-01") is None
 
-            result: PriceResult = {
+    def test_get_stats(self, cache_file):
+        """Test statistics calculation."""
+        cache = PriceCache(cache_file=cache_file, ttl_hours=1, clock=lambda: NOW)
+
+        expired_time = NOW - 2 * 3600
+        valid_time = NOW
+
+        cache._cache = {
+            "Hotel A||2026-03-01": {
                 "price": 100.0,
                 "provider": "Test",
                 "source": "test",
-                "cached": False
+                "timestamp": valid_time
+            },
+            "Hotel A||2026-03-02": {
+                "price": 110.0,
+                "provider": "Test",
+                "source": "test",
+                "timestamp": expired_time
+            },
+            "Hotel B||2026-03-01": {
+                "price": 200.0,
+                "provider": "Test",
+                "source": "test",
+                "timestamp": valid_time
             }
-            cache.set("Test Hotel", "2026-03-01", result)
+        }
 
-            assert os.path.exists(cache_file)
+        stats = cache.get_stats()
 
-    def test_handles_corrupt_cache_file(self):
+        assert stats["total_hotels"] == 2
+        assert stats["total_entries"] == 3
+        assert stats["expired_entries"] == 1
+        assert stats["valid_entries"] == 2
+
+    def test_creates_cache_directory(self, tmpdir_cls, request):
+        """Test that cache creates parent directory if needed."""
+        cache_file = os.path.join(tmpdir_cls, request.node.name, "cache.json")
+        cache = PriceCache(cache_file=cache_file, ttl_hours=24)
+
+        result: PriceResult = {
+            "price": 100.0,
+            "provider": "Test",
+            "source": "test",
+            "cached": False
+        }
+        cache.set("Test Hotel", "2026-03-01", result)
+
+        assert os.path.exists(cache_file)
+
+    def test_handles_corrupt_cache_file(self, cache_file):
         """Test that corrupt cache file is handled gracefully."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            cache_file = os.path.join(tmpdir, "cache.json")
 
-            # Write corrupt JSON
-            with open(cache_file, 'w') as f:
-                f.write("not valid json {{{")
+        # Write corrupt JSON
+        with open(cache_file, 'w') as f:
+            f.write("not valid json {{{")
 
-            # Should not raise, just start with empty cache
-            cache = PriceCache(cache_file=cache_file, ttl_hours=24)
-            assert cache._cache == {}
+        # Should not raise, just start with empty cache
+        cache = PriceCache(cache_file=cache_file, ttl_hours=24)
+        assert cache._cache == {}
 
-    def test_multiple_dates_same_hotel(self):
+    def test_multiple_dates_same_hotel(self, cache_file):
         """Test storing multiple dates for same hotel."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            cache_file = os.path.join(tmpdir, "cache.json")
-            cache = PriceCache(cache_file=cache_file, ttl_hours=24)
+        cache = PriceCache(cache_file=cache_file, ttl_hours=24)
+
+        result1: PriceResult = {
+            "price": 100.0,
+            "provider": "Test",
+            "source": "test",
+            "cached": False
+        }
+        result2: PriceResult = {
+            "price": 150.0,
+            "provider": "Test",
+            "source": "test",
+            "cached": False
+        }
+
+        cache.set("Test Hotel", "2026-03-01", result1)
+        cache.set("Test Hotel", "2026-03-02", result2)
+
+        retrieved1 = cache.get("Test Hotel", "2026-03-01")
+        retrieved2 = cache.get("Test Hotel", "2026-03-02")
+
+        assert retrieved1["price"] == 100.0
+        assert retrieved2["price"] == 150.0
+
+    def test_buffered_defers_save_until_exit(self, cache_file):
+        """Test that buffered() writes the file once, on exit."""
+        cache = PriceCache(cache_file=cache_file, ttl_hours=24)
+
+        result: PriceResult = {
+            "price": 100.0,
+            "provider": "Test",
+            "source": "test",
+            "cached": False
+        }
+
+        with patch.object(cache, "_save_cache", wraps=cache._save_cache) as save:
+            with cache.buffered():
+                cache.set("Hotel A", "2026-03-01", result)
+                cache.set("Hotel B", "2026-03-01", result)
+                assert save.call_count == 0
+                assert not os.path.exists(cache_file)
+
+            assert save.call_count == 1
+
+        reloaded = PriceCache(cache_file=cache_file, ttl_hours=24)
+        assert reloaded.get("Hotel A", "2026-03-01")["price"] == 100.0
+        assert reloaded.get("Hotel B", "2026-03-01")["price"] == 100.0
+
+    def test_loads_legacy_nested_cache_file(self, cache_file):
+        """Test that a nested {hotel: {date: entry}} file is flattened on load."""
+        legacy = {
+            "Old Hotel": {
+                "2026-03-01": {
+                    "price": 120.0,
+                    "provider": "Test",
+                    "source": "test",
+                    "timestamp": datetime.now().isoformat()
+                }
+            }
+        }
+        with open(cache_file, 'w', encoding='utf-8') as f:
+            json.dump(legacy, f)
+
+        cache = PriceCache(cache_file=cache_file, ttl_hours=24)
+
+        assert list(cache._cache) == ["Old Hotel||2026-03-01"]
+        assert cache.get("Old Hotel", "2026-03-01")["price"] == 120.0
 
-            result1: PriceResult = {
+    def test_accepts_iso_timestamps(self, cache_file):
+        """Test that ISO timestamps from older cache files still expire correctly."""
+        cache = PriceCache(cache_file=cache_file, ttl_hours=1)
+
+        cache._cache = {
+            "Old Hotel||2026-03-01": {
                 "price": 100.0,
                 "provider": "Test",
                 "source": "test",
-                "cached": False
+                "timestamp": (datetime.now() - timedelta(hours=2)).isoformat()
+            },
+            "Old Hotel||2026-03-02": {
+                "price": 110.0,
+                "provider": "Test",
+                "source": "test",
+                "timestamp": datetime.now().isoformat()
             }
-            result2: PriceResult = {
-                "price": 150.0,
+        }
+        cache._reindex()
+
+        assert cache.get("Old Hotel", "2026-03-01") is None
+        assert cache.get("Old Hotel", "2026-03-02")["price"] == 110.0
+
+    def test_lfu_eviction(self, cache_file):
+        """Test that a full cache evicts the least frequently read entry."""
+        cache = PriceCache(cache_file=cache_file, ttl_hours=24, max_entries=2)
+
+        result: PriceResult = {
+            "price": 100.0,
+            "provider": "Test",
+            "source": "test",
+            "cached": False
+        }
+        cache.set("Hotel A", "2026-03-01", result)
+        cache.set("Hotel B", "2026-03-01", result)
+
+        # Hotel A is read, so Hotel B is the least frequently used
+        cache.get("Hotel A", "2026-03-01")
+        cache.set("Hotel C", "2026-03-01", result)
+
+        assert len(cache._cache) == 2
+        assert cache.get("Hotel A", "2026-03-01") is not None
+        assert cache.get("Hotel B", "2026-03-01") is None
+        assert cache.get("Hotel C", "2026-03-01") is not None
+        assert "Hotel B" not in cache._known_hotels
+
+    def test_eviction_trims_in_batches(self, cache_file):
+        """Test that a full cache is trimmed to 90% in one eviction pass."""
+        cache = PriceCache(cache_file=cache_file, ttl_hours=24, max_entries=20)
+
+        result: PriceResult = {
+            "price": 100.0,
+            "provider": "Test",
+            "source": "test",
+            "cached": False
+        }
+        with cache.buffered():
+            for i in range(20):
+                cache.set(f"Hotel {i}", "2026-03-01", result)
+            cache.set("Hotel 20", "2026-03-01", result)
+
+            # Trimmed to 18, then the new entry was added
+            assert len(cache._cache) == 19
+
+            # The next set fits without another eviction pass
+            cache.set("Hotel 21", "2026-03-01", result)
+            assert len(cache._cache) == 20
+        assert "Hotel 20" in cache._known_hotels
+
+    def test_eviction_prefers_expired_entries(self, cache_file):
+        """Test that expired entries are evicted before valid ones."""
+        cache = PriceCache(
+            cache_file=cache_file, ttl_hours=1, max_entries=2, clock=lambda: NOW
+        )
+
+        cache._cache = {
+            "Stale Hotel||2026-03-01": {
+                "price": 100.0,
                 "provider": "Test",
                 "source": "test",
+                "timestamp": NOW - 2 * 3600
+            },
+            "Fresh Hotel||2026-03-01": {
+                "price": 200.0,
+                "provider": "Test",
+                "source": "test",
+                "timestamp": NOW
+            }
+        }
+        cache._reindex()
+
+        result: PriceResult = {
+            "price": 300.0,
+            "provider": "Test",
+            "source": "test",
+            "cached": False
+        }
+        cache.set("New Hotel", "2026-03-01", result)
+
+        assert "Stale Hotel||2026-03-01" not in cache._cache
+        assert "Fresh Hotel||2026-03-01" in cache._cache
+        assert "New Hotel||2026-03-01" in cache._cache
+
+    def test_skips_write_when_payload_unchanged(self, cache_file):
+        """Test that saving an unchanged cache does not touch the file."""
+        cache = PriceCache(cache_file=cache_file, ttl_hours=24)
+
+        result: PriceResult = {
+            "price": 100.0,
+            "provider": "Test",
+            "source": "test",
+            "cached": False
+        }
+        cache.set("Hotel A", "2026-03-01", result)
+
+        with patch("builtins.open", mock_open()) as mocked:
+            cache._save_cache()
+            mocked.assert_not_called()
+
+        # A freshly loaded cache knows the file is already up to date
+        reloaded = PriceCache(cache_file=cache_file, ttl_hours=24)
+        with patch("builtins.open", mock_open()) as mocked:
+            reloaded._save_cache()
+            mocked.assert_not_called()
+
+    def test_set_same_value_does_not_rewrite_file(self, cache_file):
+        """Test that re-caching an unchanged fresh price refreshes it without a write."""
+        current = [NOW]
+        cache = PriceCache(
+            cache_file=cache_file, ttl_hours=24, clock=lambda: current[0]
+        )
+
+        result: PriceResult = {
+            "price": 100.0,
+            "provider": "Test",
+            "source": "test",
+            "cached": False
+        }
+        cache.set("Hotel A", "2026-03-01", result)
+
+        current[0] = NOW + 60
+        with patch("builtins.open", mock_open()) as mocked:
+            cache.set("Hotel A", "2026-03-01", result)
+            mocked.assert_not_called()
+
+        # The TTL is extended in memory even though nothing was written
+        assert cache._dirty is False
+        assert cache._cache["Hotel A||2026-03-01"]["timestamp"] == NOW + 60
+
+    def test_entry_expires_when_clock_passes_ttl(self, cache_file):
+        """Test expiry driven entirely by the injected clock."""
+        current = [NOW]
+        cache = PriceCache(
+            cache_file=cache_file, ttl_hours=1, clock=lambda: current[0]
+        )
+
+        result: PriceResult = {
+            "price": 100.0,
+            "provider": "Test",
+            "source": "test",
+            "cached": False
+        }
+        cache.set("Hotel A", "2026-03-01", result)
+        assert cache._cache["Hotel A||2026-03-01"]["timestamp"] == NOW
+
+        current[0] = NOW + 3600
+        assert cache.get("Hotel A", "2026-03-01") is not None
+
+        current[0] = NOW + 3601
+        assert cache.get("Hotel A", "2026-03-01") is None
+
+    def test_interns_provider_labels(self, cache_file):
+        """Test that repeated provider/source labels share one string object."""
+        cache = PriceCache(cache_file=cache_file, ttl_hours=24)
+
+        for hotel in ("Hotel A", "Hotel B"):
+            result: PriceResult = {
+                "price": 100.0,
+                "provider": "".join(["Booking", ".com"]),
+                "source": "".join(["xot", "elo"]),
                 "cached": False
             }
+            cache.set(hotel, "2026-03-01", result)
+
+        reloaded = PriceCache(cache_file=cache_file, ttl_hours=24)
+        for store in (cache._cache, reloaded._cache):
+            first, second = store.values()
+            assert first["provider"] is second["provider"]
+            assert first["source"] is second["source"]
+
+    def test_save_is_atomic_rename(self, cache_file):
+        """Test that saves go through a temp file that is renamed into place."""
+        cache = PriceCache(cache_file=cache_file, ttl_hours=24)
+
+        result: PriceResult = {
+            "price": 100.0,
+            "provider": "Test",
+            "source": "test",
+            "cached": False
+        }
+
+        with patch("price_providers.cache.os.replace", wraps=os.replace) as replace:
+            cache.set("Hotel A", "2026-03-01", result)
 
-            cache.set("Test Hotel", "2026-03-01", result1)
-            cache.set("Test Hotel", "2026-03-02", result2)
-
-            retrieved1 = cache.get("Test Hotel", "2026-03-01")
-            retrieved2 = cache.get("Test Hotel", "2026-03-02")
-
-            assert retrieved1["price"] == 100.0
-            assert retrieved2["price"] == 150.0
+        replace.assert_called_once_with(cache_file + ".tmp", cache_file)
+        assert not os.path.exists(cache_file + ".tmp")
+        with open(cache_file, encoding="utf-8") as f:
+            assert "Hotel A||2026-03-01" in json.load(f)
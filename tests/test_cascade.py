@@ -4,12 +4,6 @@ Tests for the CascadePriceProvider.
 Tests the cascade orchestration logic, provider ordering, and statistics.
 """
 import pytest
-from unittest.mock import Mock, patch, MagicMock
-import os
-import sys
-
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from price_providers.base import PriceProvider, PriceResult
 from price_providers.cascade import CascadePriceProvider
@@ -47,7 +41,7 @@ class TestCascadePriceProvider:
         assert len(cascade.providers) == 2
         assert cascade.cache is not None
 
-    def test_get_price_first_provider_succeeds(self):
+    def test_get_price_first_provider_succeeds(self, memory_cache):
         """Test that cascade stops when first provider returns a price."""
         result1: PriceResult = {
             "price": 100.0,
@@ -59,12 +53,7 @@ class TestCascadePriceProvider:
         provider1 = MockProvider("mock1", result=result1)
         provider2 = MockProvider("mock2", result=None)
 
-        # Use a mock cache to avoid file I/O
-        mock_cache = Mock()
-        mock_cache.get.return_value = None
-        mock_cache.set = Mock()
-
-        cascade = CascadePriceProvider([provider1, provider2], cache=mock_cache)
+        cascade = CascadePriceProvider([provider1, provider2], cache=memory_cache)
 
         result = cascade.get_price(
             "Test Hotel", "key123",
@@ -75,8 +64,9 @@ class TestCascadePriceProvider:
         assert result["price"] == 100.0
         assert provider1.call_count == 1
         assert provider2.call_count == 0  # Never called
+        assert memory_cache.get("Test Hotel", "2026-03-01") == result1
 
-    def test_get_price_cascade_to_second_provider(self):
+    def test_get_price_cascade_to_second_provider(self, memory_cache):
         """Test that cascade tries second provider when first returns None."""
         result2: PriceResult = {
             "price": 150.0,
@@ -88,11 +78,7 @@ class TestCascadePriceProvider:
         provider1 = MockProvider("mock1", result=None)
         provider2 = MockProvider("mock2", result=result2)
 
-        mock_cache = Mock()
-        mock_cache.get.return_value = None
-        mock_cache.set = Mock()
-
-        cascade = CascadePriceProvider([provider1, provider2], cache=mock_cache)
+        cascade = CascadePriceProvider([provider1, provider2], cache=memory_cache)
 
         result = cascade.get_price(
             "Test Hotel", "key123",
@@ -105,16 +91,12 @@ class TestCascadePriceProvider:
         assert provider1.call_count == 1
         assert provider2.call_count == 1
 
-    def test_get_price_all_providers_fail(self):
+    def test_get_price_all_providers_fail(self, memory_cache):
         """Test when all providers return None."""
         provider1 = MockProvider("mock1", result=None)
         provider2 = MockProvider("mock2", result=None)
 
-        mock_cache = Mock()
-        mock_cache.get.return_value = None
-        mock_cache.set = Mock()
-
-        cascade = CascadePriceProvider([provider1, provider2], cache=mock_cache)
+        cascade = CascadePriceProvider([provider1, provider2], cache=memory_cache)
 
         result = cascade.get_price(
             "Test Hotel", "key123",
@@ -125,7 +107,7 @@ class TestCascadePriceProvider:
         assert provider1.call_count == 1
         assert provider2.call_count == 1
 
-    def test_get_price_from_cache(self):
+    def test_get_price_from_cache(self, memory_cache):
         """Test that cached results are returned without calling providers."""
         cached_result: PriceResult = {
             "price": 200.0,
@@ -136,10 +118,9 @@ class TestCascadePriceProvider:
 
         provider1 = MockProvider("mock1", result=None)
 
-        mock_cache = Mock()
-        mock_cache.get.return_value = cached_result
+        memory_cache.set("Test Hotel", "2026-03-01", cached_result)
 
-        cascade = CascadePriceProvider([provider1], cache=mock_cache)
+        cascade = CascadePriceProvider([provider1], cache=memory_cache)
 
         result = cascade.get_price(
             "Test Hotel", "key123",
@@ -150,7 +131,7 @@ class TestCascadePriceProvider:
         assert result["cached"] is True
         assert provider1.call_count == 0  # Provider never called
 
-    def test_skips_unavailable_providers(self):
+    def test_skips_unavailable_providers(self, memory_cache):
         """Test that unavailable providers are skipped."""
         result2: PriceResult = {
             "price": 175.0,
@@ -162,11 +143,7 @@ class TestCascadePriceProvider:
         provider1 = MockProvider("mock1", result=None, available=False)
         provider2 = MockProvider("mock2", result=result2, available=True)
 
-        mock_cache = Mock()
-        mock_cache.get.return_value = None
-        mock_cache.set = Mock()
-
-        cascade = CascadePriceProvider([provider1, provider2], cache=mock_cache)
+        cascade = CascadePriceProvider([provider1, provider2], cache=memory_cache)
 
         result = cascade.get_price(
             "Test Hotel", "key123",
@@ -178,7 +155,7 @@ class TestCascadePriceProvider:
         assert provider1.call_count == 0  # Skipped
         assert provider2.call_count == 1
 
-    def test_statistics_tracking(self):
+    def test_statistics_tracking(self, memory_cache):
         """Test that statistics are tracked correctly."""
         result1: PriceResult = {
             "price": 100.0,
@@ -190,11 +167,7 @@ class TestCascadePriceProvider:
         provider1 = MockProvider("mock1", result=result1)
         provider2 = MockProvider("mock2", result=None)
 
-        mock_cache = Mock()
-        mock_cache.get.return_value = None
-        mock_cache.set = Mock()
-
-        cascade = CascadePriceProvider([provider1, provider2], cache=mock_cache)
+        cascade = CascadePriceProvider([provider1, provider2], cache=memory_cache)
 
         # Make multiple calls
         cascade.get_price("Hotel A", "key1", "2026-03-01", "2026-03-02")
@@ -205,7 +178,7 @@ class TestCascadePriceProvider:
         assert stats["mock1"] == 2
         assert stats["not_found"] == 0
 
-    def test_statistics_with_cache_hits(self):
+    def test_statistics_with_cache_hits(self, memory_cache):
         """Test statistics with cache hits."""
         cached_result: PriceResult = {
             "price": 200.0,
@@ -216,10 +189,9 @@ class TestCascadePriceProvider:
 
         provider1 = MockProvider("mock1", result=None)
 
-        mock_cache = Mock()
-        mock_cache.get.return_value = cached_result
+        memory_cache.set("Hotel A", "2026-03-01", cached_result)
 
-        cascade = CascadePriceProvider([provider1], cache=mock_cache)
+        cascade = CascadePriceProvider([provider1], cache=memory_cache)
 
         cascade.get_price("Hotel A", "key1", "2026-03-01", "2026-03-02")
 
@@ -227,7 +199,7 @@ class TestCascadePriceProvider:
         assert stats["total"] == 1
         assert stats["cache"] == 1
 
-    def test_get_stats_summary(self):
+    def test_get_stats_summary(self, memory_cache):
         """Test formatted statistics summary."""
         result1: PriceResult = {
             "price": 100.0,
@@ -237,11 +209,7 @@ class TestCascadePriceProvider:
         }
 
         provider1 = MockProvider("mock1", result=result1)
-        mock_cache = Mock()
-        mock_cache.get.return_value = None
-        mock_cache.set = Mock()
-
-        cascade = CascadePriceProvider([provider1], cache=mock_cache)
+        cascade = CascadePriceProvider([provider1], cache=memory_cache)
         cascade.get_price("Hotel A", "key1", "2026-03-01", "2026-03-02")
 
         summary = cascade.get_stats_summary()
@@ -250,13 +218,10 @@ class TestCascadePriceProvider:
         assert "TOTAL COVERAGE:" in summary
         assert "100.0%" in summary
 
-    def test_reset_stats(self):
+    def test_reset_stats(self, memory_cache):
         """Test resetting statistics."""
         provider1 = MockProvider("mock1", result=None)
-        mock_cache = Mock()
-        mock_cache.get.return_value = None
-
-        cascade = CascadePriceProvider([provider1], cache=mock_cache)
+        cascade = CascadePriceProvider([provider1], cache=memory_cache)
 
         cascade.get_price("Hotel A", "key1", "2026-03-01", "2026-03-02")
         assert cascade.stats["total"] == 1
@@ -264,14 +229,35 @@ class TestCascadePriceProvider:
         cascade.reset_stats()
         assert cascade.stats["total"] == 0
 
-    def test_get_available_providers(self):
+    def test_get_available_providers(self, memory_cache):
         """Test listing available providers."""
         provider1 = MockProvider("mock1", available=True)
         provider2 = MockProvider("mock2", available=False)
         provider3 = MockProvider("mock3", available=True)
 
-        mock_cache = Mock()
-        cascade = CascadePriceProvider([provider1, provider2, provider3], cache=mock_cache)
+        cascade = CascadePriceProvider([provider1, provider2, provider3], cache=memory_cache)
 
         available = cascade.get_available_providers()
         assert available == ["mock1", "mock3"]
+
+    def test_refresh_providers_picks_up_availability_changes(self, memory_cache):
+        """Test that availability is fixed at init until refresh_providers()."""
+        result1: PriceResult = {
+            "price": 90.0,
+            "provider": "Provider1",
+            "source": "mock1",
+            "cached": False
+        }
+        provider1 = MockProvider("mock1", result=result1, available=False)
+
+        cascade = CascadePriceProvider([provider1], cache=memory_cache)
+        provider1._available = True
+
+        assert cascade.get_price("Hotel A", "key1", "2026-03-01", "2026-03-02") is None
+        assert provider1.call_count == 0
+
+        cascade.refresh_providers()
+        result = cascade.get_price("Hotel B", "key2", "2026-03-01", "2026-03-02")
+
+        assert result["price"] == 90.0
+        assert cascade.get_available_providers() == ["mock1"]
@@ -2,11 +2,6 @@
 Unit tests for config.py
 """
 import pytest
-import os
-import sys
-
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import config
 
@@ -4,12 +4,10 @@ Integration tests for Excel file handling.
 import pytest
 import json
 import os
-import sys
 from datetime import datetime
 from unittest.mock import patch, MagicMock
 import openpyxl
-
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from openpyxl.styles import Font
 
 import xotelo_price_updater as updater
 
@@ -58,14 +56,13 @@ class TestExcelReading:
     """Tests for reading Excel files."""
 
     def test_reads_hotel_names_from_excel(self, sample_excel):
-        wb = openpyxl.load_workbook(sample_excel)
-        ws = wb.active
-
-        hotels = []
-        for row in range(2, ws.max_row + 1):
-            name = ws.cell(row=row, column=1).value
-            if name:
-                hotels.append(name.strip())
+        wb = openpyxl.load_workbook(sample_excel, read_only=True, data_only=True)
+        hotels = [
+            name.strip()
+            for (name,) in wb.active.iter_rows(min_row=2, max_col=1, values_only=True)
+            if name
+        ]
+        wb.close()
 
         assert len(hotels) == 3
         assert "Hotel Alpha" in hotels
@@ -188,6 +185,67 @@ class TestUpdateExcelWithPrices:
         # Cleanup
         os.remove(output_file)
 
+    def test_preserves_source_columns(self, sample_excel):
+        with patch.object(updater, 'EXCEL_FILE', sample_excel):
+            excel_hotels_with_prices = {
+                3: {'price': 99.0, 'provider': 'Test', 'hotel_key': 'key-2', 'source': 'xotelo'},
+            }
+
+            search_params = {
+                'chk_in': '2026-03-01',
+                'chk_out': '2026-03-02',
+                'rooms': 1,
+                'adults': 2
+            }
+
+            output_file = updater.update_excel_with_prices(
+                excel_hotels_with_prices,
+                search_params,
+                '2026-01-30',
+                cascade_mode=True
+            )
+
+        wb = openpyxl.load_workbook(output_file)
+        ws = wb.active
+        rows = list(ws.iter_rows(values_only=True))
+
+        assert rows[0][:3] == ("Hotel Name", "Location", "Snapshot_Date")
+        assert rows[0][-1] == "Source"
+        assert rows[1][:2] == ("Hotel Alpha", "San Juan")
+        assert rows[1][2] is None  # No price for this row
+        assert rows[2][:4] == ("Hotel Beta", "Ponce", "2026-01-30", 99.0)
+        assert rows[3][:2] == ("Hotel Gamma", "Mayaguez")
+        assert ws.cell(row=1, column=3).font.b
+
+        # Cleanup
+        os.remove(output_file)
+
+    def test_preserves_source_formatting_and_sheets(self, sample_excel):
+        # Decorate the source with formatting the output must keep
+        src = openpyxl.load_workbook(sample_excel)
+        src.active.column_dimensions['A'].width = 42
+        src.active.cell(row=1, column=1).font = Font(bold=True)
+        src.create_sheet("Notes").cell(row=1, column=1, value="keep me")
+        src.save(sample_excel)
+
+        with patch.object(updater, 'EXCEL_FILE', sample_excel):
+            output_file = updater.update_excel_with_prices(
+                {2: {'price': 150.0, 'provider': 'Test', 'hotel_key': 'key-1'}},
+                {'chk_in': '2026-03-01', 'chk_out': '2026-03-02', 'rooms': 1, 'adults': 2},
+                '2026-01-30'
+            )
+
+        wb = openpyxl.load_workbook(output_file)
+        ws = wb.active
+
+        assert ws.column_dimensions['A'].width == 42
+        assert ws.cell(row=1, column=1).font.b
+        assert wb["Notes"].cell(row=1, column=1).value == "keep me"
+        assert ws.cell(row=2, column=4).value == 150.0
+
+        # Cleanup
+        os.remove(output_file)
+
 
 class TestKeyManagerExcelReading:
     """Tests for key_manager Excel reading."""
@@ -202,6 +260,15 @@ class TestKeyManagerExcelReading:
         # Should be sorted
         assert hotels == sorted(hotels)
 
+    def test_get_excel_hotels_openpyxl_fallback(self, sample_excel):
+        import key_manager
+
+        with patch.object(key_manager, 'EXCEL_FILE', sample_excel), \
+                patch.object(key_manager, 'CALAMINE_AVAILABLE', False):
+            hotels = key_manager.get_excel_hotels()
+
+        assert hotels == ["Hotel Alpha", "Hotel Beta", "Hotel Gamma"]
+
     def test_handles_missing_file(self, tmp_path):
         import key_manager
 
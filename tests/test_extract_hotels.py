@@ -1,19 +1,25 @@
 """
 Unit tests for extract_all_hotels.py
 """
+import functools
 import pytest
 import json
 import os
-import sys
 from unittest.mock import patch, MagicMock
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 import extract_all_hotels as extractor
 from xotelo_api import XoteloAPI
 
 
+@functools.lru_cache(maxsize=None)
+def _fake_hotels(start, stop):
+    """Raw /list payload for hotels start..stop-1 (shared; copy before mutating)."""
+    return tuple(
+        {'name': f'Hotel {i}', 'key': f'key-{i}', 'url': '', 'accommodation_type': ''}
+        for i in range(start, stop)
+    )
+
+
 class TestExtractHotelData:
     """Tests for extract_hotel_data function."""
 
@@ -41,55 +47,35 @@ class TestExtractHotelData:
         assert result[0]['rating'] == 4.5
         assert result[0]['review_count'] == 100
 
-    def test_handles_missing_review_summary(self):
-        raw_hotels = [
-            {
-                'name': 'Hotel Without Reviews',
-                'key': 'no-review-key',
-                'url': 'https://example.com',
-                'accommodation_type': 'inn'
-            }
-        ]
-
-        result = extractor.extract_hotel_data(raw_hotels)
-
-        assert len(result) == 1
-        assert result[0]['rating'] is None
-        assert result[0]['review_count'] is None
-
-    def test_handles_empty_list(self):
-        result = extractor.extract_hotel_data([])
-
-        assert result == []
-
-    def test_handles_multiple_hotels(self):
-        raw_hotels = [
-            {'name': 'Hotel A', 'key': 'a', 'url': '', 'accommodation_type': ''},
-            {'name': 'Hotel B', 'key': 'b', 'url': '', 'accommodation_type': ''},
-            {'name': 'Hotel C', 'key': 'c', 'url': '', 'accommodation_type': ''}
-        ]
-
+    @pytest.mark.parametrize("raw_hotels, expected_names, expected_reviews", [
+        pytest.param(
+            [{'name': 'Hotel Without Reviews', 'key': 'no-review-key',
+              'url': 'https://example.com', 'accommodation_type': 'inn'}],
+            ['Hotel Without Reviews'], (None, None),
+            id="missing_review_summary"
+        ),
+        pytest.param([], [], None, id="empty_list"),
+        pytest.param(
+            [{'name': 'Hotel A', 'key': 'a', 'url': '', 'accommodation_type': ''},
+             {'name': 'Hotel B', 'key': 'b', 'url': '', 'accommodation_type': ''},
+             {'name': 'Hotel C', 'key': 'c', 'url': '', 'accommodation_type': ''}],
+            ['Hotel A', 'Hotel B', 'Hotel C'], (None, None),
+            id="multiple_hotels"
+        ),
+    ])
+    def test_extract_variants(self, raw_hotels, expected_names, expected_reviews):
         result = extractor.extract_hotel_data(raw_hotels)
 
-        assert len(result) == 3
-        assert result[0]['name'] == 'Hotel A'
-        assert result[2]['name'] == 'Hotel C'
+        assert [hotel['name'] for hotel in result] == expected_names
+        if expected_reviews is not None:
+            assert (result[0]['rating'], result[0]['review_count']) == expected_reviews
 
 
 class TestSaveToJson:
     """Tests for save_to_json function."""
 
-    def test_saves_valid_json(self, tmp_path):
-        hotel_data = [
-            extractor.HotelData(
-                name='Test Hotel',
-                key='test-key',
-                url='https://example.com',
-                accommodation_type='hotel',
-                rating=4.0,
-                review_count=50
-            )
-        ]
+    def test_saves_valid_json(self, tmp_path, sample_hotel):
+        hotel_data = [sample_hotel]
         filename = str(tmp_path / "test_output.json")
 
         extractor.save_to_json(hotel_data, filename)
@@ -124,47 +110,17 @@ class TestSaveToJson:
 class TestSaveToExcel:
     """Tests for save_to_excel function."""
 
-    def test_creates_excel_file(self, tmp_path):
-        hotel_data = [
-            extractor.HotelData(
-                name='Test Hotel',
-                key='test-key',
-                url='https://example.com',
-                accommodation_type='hotel',
-                rating=4.0,
-                review_count=50
-            )
-        ]
+    def test_creates_excel_file(self, tmp_path, sample_hotel):
+        hotel_data = [sample_hotel]
         filename = str(tmp_path / "test_output.xlsx")
 
         extractor.save_to_excel(hotel_data, filename)
 
         assert os.path.exists(filename)
 
-    def test_excel_has_correct_headers(self, tmp_path):
-        import openpyxl
-
-        hotel_data = [
-            extractor.HotelData(
-                name='Test',
-                key='key',
-                url='url',
-                accommodation_type='type',
-                rating=1.0,
-                review_count=1
-            )
-        ]
-        filename = str(tmp_path / "headers_test.xlsx")
-
-        extractor.save_to_excel(hotel_data, filename)
-
-        wb = openpyxl.load_workbook(filename)
-        ws = wb.active
-
-        headers = [ws.cell(row=1, column=c).value for c in range(1, 8)]
-        assert headers == ["#", "Hotel Name", "Key", "URL", "Type", "Rating", "Reviews"]
-
-    def test_excel_has_correct_data(self, tmp_path):
+    @pytest.fixture(scope="class")
+    def saved_sheet(self, tmp_path_factory):
+        """Active sheet of one workbook written by save_to_excel, shared by the class."""
         import openpyxl
 
         hotel_data = [
@@ -177,21 +133,33 @@ class TestSaveToExcel:
                 review_count=200
             )
         ]
-        filename = str(tmp_path / "data_test.xlsx")
+        filename = str(tmp_path_factory.mktemp("excel") / "data_test.xlsx")
 
         extractor.save_to_excel(hotel_data, filename)
 
-        wb = openpyxl.load_workbook(filename)
-        ws = wb.active
+        return openpyxl.load_workbook(filename).active
+
+    def test_excel_has_correct_headers(self, saved_sheet):
+        headers = next(saved_sheet.iter_rows(min_row=1, max_row=1, max_col=7, values_only=True))
+        assert headers == ("#", "Hotel Name", "Key", "URL", "Type", "Rating", "Reviews")
+
+    def test_excel_has_correct_data(self, saved_sheet):
+        row = next(saved_sheet.iter_rows(min_row=2, max_row=2, max_col=7, values_only=True))
 
         # Check data in row 2
-        assert ws.cell(row=2, column=1).value == 1  # Index
-        assert ws.cell(row=2, column=2).value == 'Sample Hotel'
-        assert ws.cell(row=2, column=3).value == 'sample-key'
-        assert ws.cell(row=2, column=4).value == 'https://sample.com'
-        assert ws.cell(row=2, column=5).value == 'resort'
-        assert ws.cell(row=2, column=6).value == 4.5
-        assert ws.cell(row=2, column=7).value == 200
+        assert row[0] == 1  # Index
+        assert row[1] == 'Sample Hotel'
+        assert row[2] == 'sample-key'
+        assert row[3] == 'https://sample.com'
+        assert row[4] == 'resort'
+        assert row[5] == 4.5
+        assert row[6] == 200
+
+    def test_excel_keeps_sheet_layout(self, saved_sheet):
+        assert saved_sheet.title == "Hotels Puerto Rico"
+        assert saved_sheet.cell(row=1, column=2).font.b
+        assert saved_sheet.cell(row=1, column=2).alignment.horizontal == 'center'
+        assert saved_sheet.column_dimensions['D'].width == 80
 
 
 class TestMainIntegration:
@@ -206,10 +174,8 @@ class TestMainIntegration:
     ):
         # Simulate pagination: first call returns 100 hotels, second returns remaining
         mock_list.side_effect = [
-            ([{'name': f'Hotel {i}', 'key': f'key-{i}', 'url': '', 'accommodation_type': ''}
-              for i in range(100)], 150),
-            ([{'name': f'Hotel {i}', 'key': f'key-{i}', 'url': '', 'accommodation_type': ''}
-              for i in range(100, 150)], 150),
+            (list(_fake_hotels(0, 100)), 150),
+            (list(_fake_hotels(100, 150)), 150),
         ]
 
         extractor.main()
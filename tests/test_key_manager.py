@@ -3,21 +3,33 @@ Integration tests for key_manager.py Flask app
 """
 import pytest
 import json
-import os
-import sys
-from unittest.mock import patch, MagicMock
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import openpyxl
 
 import key_manager
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client():
-    """Create a test client for the Flask app."""
+    """Create one test client for the Flask app, shared by the module.
+
+    Per-test state (MAPPING_FILE, load_mapping, ...) is still patched with
+    function scope, so sharing the client does not leak between tests.
+    """
     key_manager.app.config['TESTING'] = True
-    with key_manager.app.test_client() as client:
-        yield client
+    yield key_manager.app.test_client()
+
+
+@pytest.fixture(scope="module")
+def mapping_dir(tmp_path_factory):
+    """One temp directory for every mapping file written by this module."""
+    return tmp_path_factory.mktemp("mapping")
+
+
+@pytest.fixture
+def mapping_file(mapping_dir, request):
+    """Per-test mapping path inside the shared directory."""
+    return mapping_dir / f"{request.node.name}.json"
 
 
 @pytest.fixture
@@ -43,37 +55,38 @@ class TestIndexRoute:
 class TestGetHotelsAPI:
     """Tests for /api/hotels endpoint."""
 
-    def test_returns_hotels_list(self, client, mock_excel_hotels, mock_mapping):
-        with patch.object(key_manager, 'get_excel_hotels', return_value=mock_excel_hotels):
-            with patch.object(key_manager, 'load_mapping', return_value=mock_mapping):
-                response = client.get('/api/hotels')
+    def test_returns_hotels_list(self, client, mock_excel_hotels, mock_mapping, monkeypatch):
+        monkeypatch.setattr(key_manager, 'get_excel_hotels', lambda: mock_excel_hotels)
+        monkeypatch.setattr(key_manager, 'load_mapping', lambda: mock_mapping)
+        response = client.get('/api/hotels')
 
         assert response.status_code == 200
-        data = json.loads(response.data)
+        data = response.get_json()
         assert len(data) == 3
 
-    def test_includes_mapping_status(self, client, mock_excel_hotels, mock_mapping):
-        with patch.object(key_manager, 'get_excel_hotels', return_value=mock_excel_hotels):
-            with patch.object(key_manager, 'load_mapping', return_value=mock_mapping):
-                response = client.get('/api/hotels')
+    def test_includes_mapping_status(self, client, mock_excel_hotels, mock_mapping, monkeypatch):
+        monkeypatch.setattr(key_manager, 'get_excel_hotels', lambda: mock_excel_hotels)
+        monkeypatch.setattr(key_manager, 'load_mapping', lambda: mock_mapping)
+        response = client.get('/api/hotels')
 
-        data = json.loads(response.data)
+        data = response.get_json()
+
+        by_name = {h['name']: h for h in data}
 
         # Hotel Alpha should be mapped
-        alpha = next(h for h in data if h['name'] == 'Hotel Alpha')
+        alpha = by_name['Hotel Alpha']
         assert alpha['status'] == 'mapped'
         assert alpha['key'] == 'g147319-d123456'
 
         # Hotel Beta should not be mapped
-        beta = next(h for h in data if h['name'] == 'Hotel Beta')
+        beta = by_name['Hotel Beta']
         assert beta['status'] == 'unmapped'
 
 
 class TestSearchAPI:
     """Tests for /api/search endpoint."""
 
-    def test_search_returns_results_from_cache(self, client, tmp_path):
-        # Create a mock cache file
+    def test_search_returns_results_from_cache(self, client, tmp_path, monkeypatch):
         cache_data = [
             {'key': 'g147319-d111', 'name': 'Test Hotel One', 'location': 'San Juan'},
             {'key': 'g147319-d222', 'name': 'Test Hotel Two', 'location': 'Ponce'},
@@ -81,24 +94,21 @@ class TestSearchAPI:
         ]
         cache_file = tmp_path / "api_hotels_cache.json"
         cache_file.write_text(json.dumps(cache_data))
+        monkeypatch.setattr(key_manager, 'API_HOTELS_CACHE', str(cache_file))
 
-        with patch.object(os.path, 'exists', side_effect=lambda p: p == str(cache_file) or os.path.exists(p)):
-            with patch('key_manager.os.path.exists', return_value=True):
-                with patch('builtins.open', create=True) as mock_open:
-                    mock_open.return_value.__enter__.return_value.read.return_value = json.dumps(cache_data)
-                    # The actual implementation reads from file, so we need to patch at module level
-                    pass
-
-        # Simplified test - just verify the endpoint responds
         response = client.get('/api/search?q=test')
-        assert response.status_code in [200, 500]  # 500 if cache doesn't exist
+
+        assert response.status_code == 200
+        data = response.get_json()
+        assert [h['hotel_key'] for h in data] == ['g147319-d111', 'g147319-d222']
+        assert data[0]['short_place_name'] == 'San Juan'
 
     def test_search_returns_empty_for_short_query(self, client):
         """Query must be at least 2 characters."""
         response = client.get('/api/search?q=t')
 
         assert response.status_code == 200
-        data = json.loads(response.data)
+        data = response.get_json()
         assert data == []
 
     def test_search_returns_empty_for_missing_query(self, client):
@@ -106,35 +116,33 @@ class TestSearchAPI:
         response = client.get('/api/search')
 
         assert response.status_code == 200
-        data = json.loads(response.data)
+        data = response.get_json()
         assert data == []
 
 
 class TestMapAPI:
     """Tests for /api/map endpoint."""
 
-    def test_map_saves_mapping(self, client, tmp_path):
-        test_file = tmp_path / "mapping.json"
-        test_file.write_text("{}")
+    def test_map_saves_mapping(self, client, mapping_file, monkeypatch):
+        mapping_file.write_text("{}")
 
-        with patch.object(key_manager, 'MAPPING_FILE', str(test_file)):
-            response = client.post('/api/map', json={
-                'excel_name': 'New Hotel',
-                'api_key': 'g147319-d999'
-            })
+        monkeypatch.setattr(key_manager, 'MAPPING_FILE', str(mapping_file))
+        response = client.post('/api/map', json={
+            'excel_name': 'New Hotel',
+            'api_key': 'g147319-d999'
+        })
 
         assert response.status_code == 200
 
-        saved = json.loads(test_file.read_text())
+        saved = json.loads(mapping_file.read_text())
         assert saved['New Hotel'] == 'g147319-d999'
 
-    def test_map_requires_excel_name(self, client):
-        response = client.post('/api/map', json={'api_key': 'g147319-d999'})
-
-        assert response.status_code == 400
-
-    def test_map_requires_api_key(self, client):
-        response = client.post('/api/map', json={'excel_name': 'Test Hotel'})
+    @pytest.mark.parametrize("payload", [
+        pytest.param({'api_key': 'g147319-d999'}, id="missing_excel_name"),
+        pytest.param({'excel_name': 'Test Hotel'}, id="missing_api_key"),
+    ])
+    def test_map_requires_both_fields(self, client, payload):
+        response = client.post('/api/map', json=payload)
 
         assert response.status_code == 400
 
@@ -142,45 +150,72 @@ class TestMapAPI:
 class TestUnmapAPI:
     """Tests for /api/unmap endpoint."""
 
-    def test_unmap_removes_mapping(self, client, tmp_path):
-        test_file = tmp_path / "mapping.json"
-        test_file.write_text('{"Hotel X": "key-x"}')
+    def test_unmap_removes_mapping(self, client, mapping_file, monkeypatch):
+        mapping_file.write_text('{"Hotel X": "key-x"}')
+        saved = []
 
-        with patch.object(key_manager, 'MAPPING_FILE', str(test_file)):
-            with patch.object(key_manager, 'load_mapping', return_value={"Hotel X": "key-x"}):
-                with patch.object(key_manager, 'save_mapping') as mock_save:
-                    response = client.post('/api/unmap', json={'excel_name': 'Hotel X'})
-
-                    # Verify save_mapping was called with the hotel removed
-                    if mock_save.called:
-                        saved_mapping = mock_save.call_args[0][0]
-                        assert 'Hotel X' not in saved_mapping
+        monkeypatch.setattr(key_manager, 'MAPPING_FILE', str(mapping_file))
+        monkeypatch.setattr(key_manager, 'load_mapping', lambda: {"Hotel X": "key-x"})
+        monkeypatch.setattr(key_manager, 'save_mapping', saved.append)
+        response = client.post('/api/unmap', json={'excel_name': 'Hotel X'})
 
         assert response.status_code == 200
+        # Verify save_mapping was called with the hotel removed
+        assert saved == [{}]
 
-    def test_unmap_succeeds_for_nonexistent_hotel(self, client):
+    def test_unmap_succeeds_for_nonexistent_hotel(self, client, monkeypatch):
         """Unmapping a hotel that doesn't exist should still succeed."""
-        with patch.object(key_manager, 'load_mapping', return_value={}):
-            response = client.post('/api/unmap', json={'excel_name': 'Nonexistent Hotel'})
+        monkeypatch.setattr(key_manager, 'load_mapping', lambda: {})
+        response = client.post('/api/unmap', json={'excel_name': 'Nonexistent Hotel'})
 
         assert response.status_code == 200
 
 
+class TestGetExcelHotels:
+    """Tests for get_excel_hotels (calamine and openpyxl paths)."""
+
+    @pytest.fixture(scope="class")
+    def hotels_workbook(self, tmp_path_factory):
+        """Active second sheet starting with a blank row and a numeric name."""
+        wb = openpyxl.Workbook()
+        wb.active.title = "Other"
+        wb.active["A2"] = "Wrong Sheet Hotel"
+        ws = wb.create_sheet("Hotels")
+        ws["A2"] = "Hotel A"
+        ws["A3"] = 123
+        ws["A4"] = " Hotel B "
+        wb.active = ws
+        path = tmp_path_factory.mktemp("excel") / "hotels.xlsx"
+        wb.save(path)
+        return str(path)
+
+    @pytest.mark.parametrize("use_calamine", [
+        pytest.param(True, marks=pytest.mark.skipif(
+            not key_manager.CALAMINE_AVAILABLE, reason="python-calamine not installed"
+        )),
+        False,
+    ], ids=["calamine", "openpyxl"])
+    def test_paths_agree(self, hotels_workbook, use_calamine, monkeypatch):
+        monkeypatch.setattr(key_manager, 'EXCEL_FILE', hotels_workbook)
+        monkeypatch.setattr(key_manager, 'CALAMINE_AVAILABLE', use_calamine)
+
+        assert key_manager.get_excel_hotels() == ["123", "Hotel A", "Hotel B"]
+
+
 class TestLoadMapping:
     """Tests for load_mapping function."""
 
-    def test_loads_existing_file(self, tmp_path):
-        test_file = tmp_path / "mapping.json"
-        test_file.write_text('{"Hotel A": "key-a"}')
+    def test_loads_existing_file(self, mapping_file, monkeypatch):
+        mapping_file.write_text('{"Hotel A": "key-a"}')
 
-        with patch.object(key_manager, 'MAPPING_FILE', str(test_file)):
-            mapping = key_manager.load_mapping()
+        monkeypatch.setattr(key_manager, 'MAPPING_FILE', str(mapping_file))
+        mapping = key_manager.load_mapping()
 
         assert mapping == {"Hotel A": "key-a"}
 
-    def test_returns_empty_dict_if_no_file(self, tmp_path):
-        with patch.object(key_manager, 'MAPPING_FILE', str(tmp_path / "nonexistent.json")):
-            mapping = key_manager.load_mapping()
+    def test_returns_empty_dict_if_no_file(self, mapping_file, monkeypatch):
+        monkeypatch.setattr(key_manager, 'MAPPING_FILE', str(mapping_file))
+        mapping = key_manager.load_mapping()
 
         assert mapping == {}
 
@@ -188,11 +223,9 @@ class TestLoadMapping:
 class TestSaveMapping:
     """Tests for save_mapping function."""
 
-    def test_saves_mapping_to_file(self, tmp_path):
-        test_file = tmp_path / "mapping.json"
-
-        with patch.object(key_manager, 'MAPPING_FILE', str(test_file)):
-            key_manager.save_mapping({"Hotel A": "key-a", "Hotel B": "key-b"})
+    def test_saves_mapping_to_file(self, mapping_file, monkeypatch):
+        monkeypatch.setattr(key_manager, 'MAPPING_FILE', str(mapping_file))
+        key_manager.save_mapping({"Hotel A": "key-a", "Hotel B": "key-b"})
 
-        saved = json.loads(test_file.read_text())
+        saved = json.loads(mapping_file.read_text())
         assert saved == {"Hotel A": "key-a", "Hotel B": "key-b"}
@@ -1,23 +1,15 @@
 """
 Unit tests for xotelo_price_fixer.py
 """
-import os
-import sys
-from datetime import datetime, timedelta
-from unittest.mock import patch, MagicMock
-
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import xotelo_price_fixer as fixer
-from xotelo_api import XoteloAPI, HotelInfo, RateInfo
+from xotelo_api import HotelInfo, RateInfo
 
 
 class TestSearchHotel:
     """Tests for search_hotel function."""
 
-    def test_returns_hotel_info_on_success(self):
-        mock_api = MagicMock(spec=XoteloAPI)
+    def test_returns_hotel_info_on_success(self, mock_api):
         mock_api.search_hotel.return_value = HotelInfo(
             key='test-key',
             name='Test Hotel',
@@ -30,8 +22,7 @@ class TestSearchHotel:
         assert result['key'] == 'test-key'
         assert result['name'] == 'Test Hotel'
 
-    def test_returns_none_on_not_found(self):
-        mock_api = MagicMock(spec=XoteloAPI)
+    def test_returns_none_on_not_found(self, mock_api):
         mock_api.search_hotel.return_value = None
 
         result = fixer.search_hotel(mock_api, "NonexistentHotel")
@@ -42,8 +33,7 @@ class TestSearchHotel:
 class TestGetHotelRates:
     """Tests for get_hotel_rates function."""
 
-    def test_returns_rate_info_on_success(self):
-        mock_api = MagicMock(spec=XoteloAPI)
+    def test_returns_rate_info_on_success(self, mock_api):
         mock_api.get_rates.return_value = RateInfo(
             rate=150.0,
             provider='Booking.com',
@@ -56,16 +46,14 @@ class TestGetHotelRates:
         assert result['rate'] == 150.0
         assert result['provider'] == 'Booking.com'
 
-    def test_returns_none_on_no_rates(self):
-        mock_api = MagicMock(spec=XoteloAPI)
+    def test_returns_none_on_no_rates(self, mock_api):
         mock_api.get_rates.return_value = None
 
         result = fixer.get_hotel_rates(mock_api, "test-key", "2026-03-01", "2026-03-02")
 
         assert result is None
 
-    def test_uses_provided_dates(self):
-        mock_api = MagicMock(spec=XoteloAPI)
+    def test_uses_provided_dates(self, mock_api):
         mock_api.get_rates.return_value = None
 
         fixer.get_hotel_rates(mock_api, "test-key", "2026-03-01", "2026-03-02")
@@ -80,8 +68,7 @@ class TestGetHotelRates:
 class TestProcessUnmatchedHotels:
     """Tests for process_unmatched_hotels function."""
 
-    def test_searches_hotel_and_updates_worksheet(self):
-        mock_api = MagicMock(spec=XoteloAPI)
+    def test_searches_hotel_and_updates_worksheet(self, mock_api, recording_ws):
         mock_api.search_hotel.return_value = HotelInfo(
             key='found-key',
             name='Found Hotel',
@@ -94,23 +81,20 @@ class TestProcessUnmatchedHotels:
         )
         mock_api.wait.return_value = None
 
-        mock_ws = MagicMock()
-
         no_match = [(2, "Test Hotel")]
 
         updated = fixer.process_unmatched_hotels(
-            mock_api, mock_ws, no_match,
+            mock_api, recording_ws, no_match,
             price_col=3, provider_col=4, match_col=5, score_col=6, key_col=7,
             check_in_date="2026-03-01", check_out_date="2026-03-02"
         )
 
         assert updated == 1
-        mock_ws.cell.assert_any_call(row=2, column=3, value=100.0)
-        mock_ws.cell.assert_any_call(row=2, column=4, value='Agoda')
-        mock_ws.cell.assert_any_call(row=2, column=7, value='found-key')
+        recording_ws.assert_cell_called(row=2, column=3, value=100.0)
+        recording_ws.assert_cell_called(row=2, column=4, value='Agoda')
+        recording_ws.assert_cell_called(row=2, column=7, value='found-key')
 
-    def test_skips_hotels_not_in_puerto_rico(self):
-        mock_api = MagicMock(spec=XoteloAPI)
+    def test_skips_hotels_not_in_puerto_rico(self, mock_api, recording_ws):
         mock_api.search_hotel.return_value = HotelInfo(
             key='wrong-key',
             name='Wrong Hotel',
@@ -118,22 +102,19 @@ class TestProcessUnmatchedHotels:
         )
         mock_api.wait.return_value = None
 
-        mock_ws = MagicMock()
-
         no_match = [(2, "Test Hotel")]
 
         updated = fixer.process_unmatched_hotels(
-            mock_api, mock_ws, no_match,
+            mock_api, recording_ws, no_match,
             price_col=3, provider_col=4, match_col=5, score_col=6, key_col=7,
             check_in_date="2026-03-01", check_out_date="2026-03-02"
         )
 
         assert updated == 0
         # Should mark as "Not found"
-        mock_ws.cell.assert_any_call(row=2, column=4, value="Not found")
+        recording_ws.assert_cell_called(row=2, column=4, value="Not found")
 
-    def test_tries_multiple_search_variations(self):
-        mock_api = MagicMock(spec=XoteloAPI)
+    def test_tries_multiple_search_variations(self, mock_api, recording_ws):
         # First 3 searches return None, 4th returns result
         mock_api.search_hotel.side_effect = [
             None, None, None,
@@ -142,13 +123,11 @@ class TestProcessUnmatchedHotels:
         mock_api.get_rates.return_value = None
         mock_api.wait.return_value = None
 
-        mock_ws = MagicMock()
-
         # Hotel name with parentheses will trigger multiple variations
         no_match = [(2, "Test Hotel (Downtown)")]
 
         fixer.process_unmatched_hotels(
-            mock_api, mock_ws, no_match,
+            mock_api, recording_ws, no_match,
             price_col=3, provider_col=4, match_col=5, score_col=6, key_col=7,
             check_in_date="2026-03-01", check_out_date="2026-03-02"
         )
@@ -160,8 +139,7 @@ class TestProcessUnmatchedHotels:
 class TestProcessNoPriceHotels:
     """Tests for process_no_price_hotels function."""
 
-    def test_retries_getting_price(self):
-        mock_api = MagicMock(spec=XoteloAPI)
+    def test_retries_getting_price(self, mock_api, recording_ws):
         mock_api.get_rates.return_value = RateInfo(
             rate=200.0,
             provider='Hotels.com',
@@ -169,48 +147,40 @@ class TestProcessNoPriceHotels:
         )
         mock_api.wait.return_value = None
 
-        mock_ws = MagicMock()
-
         no_price = [(2, "Test Hotel", "Matched Name", "existing-key")]
 
         updated = fixer.process_no_price_hotels(
-            mock_api, mock_ws, no_price,
+            mock_api, recording_ws, no_price,
             price_col=3, provider_col=4,
             check_in_date="2026-03-01", check_out_date="2026-03-02"
         )
 
         assert updated == 1
-        mock_ws.cell.assert_any_call(row=2, column=3, value=200.0)
-        mock_ws.cell.assert_any_call(row=2, column=4, value='Hotels.com')
+        recording_ws.assert_cell_called(row=2, column=3, value=200.0)
+        recording_ws.assert_cell_called(row=2, column=4, value='Hotels.com')
 
-    def test_handles_still_no_price(self):
-        mock_api = MagicMock(spec=XoteloAPI)
+    def test_handles_still_no_price(self, mock_api, recording_ws):
         mock_api.get_rates.return_value = None
         mock_api.wait.return_value = None
 
-        mock_ws = MagicMock()
-
         no_price = [(2, "Test Hotel", "Matched Name", "existing-key")]
 
         updated = fixer.process_no_price_hotels(
-            mock_api, mock_ws, no_price,
+            mock_api, recording_ws, no_price,
             price_col=3, provider_col=4,
             check_in_date="2026-03-01", check_out_date="2026-03-02"
         )
 
         assert updated == 0
-        mock_ws.cell.assert_any_call(row=2, column=4, value="No price available")
+        recording_ws.assert_cell_called(row=2, column=4, value="No price available")
 
-    def test_handles_missing_hotel_key(self):
-        mock_api = MagicMock(spec=XoteloAPI)
+    def test_handles_missing_hotel_key(self, mock_api, recording_ws):
         mock_api.wait.return_value = None
 
-        mock_ws = MagicMock()
-
         no_price = [(2, "Test Hotel", "Matched Name", None)]
 
         updated = fixer.process_no_price_hotels(
-            mock_api, mock_ws, no_price,
+            mock_api, recording_ws, no_price,
             price_col=3, provider_col=4,
             check_in_date="2026-03-01", check_out_date="2026-03-02"
         )
@@ -236,7 +206,8 @@ class TestResolveDates:
         assert check_in == "2026-03-01"
         assert check_out == "2026-03-02"
 
-    def test_resolve_dates_with_relative_defaults(self):
+    def test_resolve_dates_with_relative_defaults(self, monkeypatch, frozen_datetime):
+        monkeypatch.setattr(fixer, "datetime", frozen_datetime)
         args = type("Args", (), {
             "check_in": None,
             "check_out": None,
@@ -246,8 +217,5 @@ class TestResolveDates:
 
         check_in, check_out = fixer.resolve_dates(args)
 
-        expected_check_in = (datetime.now() + timedelta(days=30)).strftime("%Y-%m-%d")
-        expected_check_out = (datetime.strptime(expected_check_in, "%Y-%m-%d") + timedelta(days=2)).strftime("%Y-%m-%d")
-
-        assert check_in == expected_check_in
-        assert check_out == expected_check_out
+        assert check_in == "2026-03-03"
+        assert check_out == "2026-03-05"
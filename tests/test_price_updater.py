@@ -3,76 +3,75 @@ Unit tests for xotelo_price_updater.py
 """
 import pytest
 import json
-import os
-import sys
-from datetime import datetime, timedelta
-from unittest.mock import patch, MagicMock
-
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from datetime import datetime
 
 import xotelo_price_updater as updater
-from xotelo_api import XoteloAPI, RateInfo
+from xotelo_api import RateInfo
+
+TEST_KEYS = {"Hotel A": "key-a", "Hotel B": "key-b"}
+TEST_KEYS_JSON = json.dumps(TEST_KEYS)
+AGODA_RATE = RateInfo(rate=120, provider='Agoda', code='AG')
+GENERIC_RATE = RateInfo(rate=100, provider='Test', code='T')
 
 
 class TestGetAutoParams:
     """Tests for get_auto_params function."""
 
-    def test_returns_dict_with_required_keys(self):
-        params = updater.get_auto_params()
+    @pytest.fixture(scope="class")
+    def auto_params(self, frozen_datetime):
+        """get_auto_params() computed once, with today frozen at 2026-02-01."""
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(updater, "datetime", frozen_datetime)
+            return updater.get_auto_params()
 
-        assert 'chk_in' in params
-        assert 'chk_out' in params
-        assert 'rooms' in params
-        assert 'adults' in params
-        assert 'nights' in params
+    def test_returns_dict_with_required_keys(self, auto_params):
+        assert 'chk_in' in auto_params
+        assert 'chk_out' in auto_params
+        assert 'rooms' in auto_params
+        assert 'adults' in auto_params
+        assert 'nights' in auto_params
 
-    def test_checkin_is_30_days_ahead(self):
-        params = updater.get_auto_params()
-        expected_date = (datetime.now() + timedelta(days=30)).strftime("%Y-%m-%d")
+    def test_checkin_is_30_days_ahead(self, auto_params):
+        assert auto_params['chk_in'] == "2026-03-03"
 
-        assert params['chk_in'] == expected_date
-
-    def test_checkout_is_one_night_after_checkin(self):
-        params = updater.get_auto_params()
-        checkin = datetime.strptime(params['chk_in'], "%Y-%m-%d")
-        checkout = datetime.strptime(params['chk_out'], "%Y-%m-%d")
+    def test_checkout_is_one_night_after_checkin(self, auto_params):
+        checkin = datetime.strptime(auto_params['chk_in'], "%Y-%m-%d")
+        checkout = datetime.strptime(auto_params['chk_out'], "%Y-%m-%d")
 
         assert (checkout - checkin).days == 1
 
-    def test_default_rooms_and_adults(self):
-        params = updater.get_auto_params()
+    def test_default_rooms_and_adults(self, auto_params):
+        assert auto_params['rooms'] == 1
+        assert auto_params['adults'] == 2
+
 
-        assert params['rooms'] == 1
-        assert params['adults'] == 2
+@pytest.fixture(scope="module")
+def key_files(tmp_path_factory):
+    """Directory pre-seeded once with valid and invalid key databases."""
+    d = tmp_path_factory.mktemp("keys")
+    (d / "valid.json").write_text(TEST_KEYS_JSON)
+    (d / "invalid.json").write_text("not valid json {{{")
+    return d
 
 
 class TestLoadHotelKeys:
     """Tests for load_hotel_keys function."""
 
-    def test_loads_keys_from_file(self, tmp_path):
-        # Create a test JSON file
-        test_keys = {"Hotel A": "key-a", "Hotel B": "key-b"}
-        test_file = tmp_path / "test_keys.json"
-        test_file.write_text(json.dumps(test_keys))
+    def test_loads_keys_from_file(self, key_files, monkeypatch):
+        monkeypatch.setattr(updater, 'HOTEL_KEYS_DB', str(key_files / "valid.json"))
+        keys = updater.load_hotel_keys()
 
-        with patch.object(updater, 'HOTEL_KEYS_DB', str(test_file)):
-            keys = updater.load_hotel_keys()
+        assert keys == TEST_KEYS
 
-        assert keys == test_keys
-
-    def test_returns_empty_dict_if_file_not_found(self, tmp_path):
-        with patch.object(updater, 'HOTEL_KEYS_DB', str(tmp_path / "nonexistent.json")):
-            keys = updater.load_hotel_keys()
+    def test_returns_empty_dict_if_file_not_found(self, key_files, monkeypatch):
+        monkeypatch.setattr(updater, 'HOTEL_KEYS_DB', str(key_files / "nonexistent.json"))
+        keys = updater.load_hotel_keys()
 
         assert keys == {}
 
-    def test_returns_empty_dict_on_invalid_json(self, tmp_path):
-        test_file = tmp_path / "invalid.json"
-        test_file.write_text("not valid json {{{")
-
-        with patch.object(updater, 'HOTEL_KEYS_DB', str(test_file)):
-            keys = updater.load_hotel_keys()
+    def test_returns_empty_dict_on_invalid_json(self, key_files, monkeypatch):
+        monkeypatch.setattr(updater, 'HOTEL_KEYS_DB', str(key_files / "invalid.json"))
+        keys = updater.load_hotel_keys()
 
         assert keys == {}
 
@@ -80,20 +79,14 @@ class TestLoadHotelKeys:
 class TestGetHotelRates:
     """Tests for get_hotel_rates wrapper function."""
 
-    @patch.object(XoteloAPI, 'get_rates')
     def test_returns_lowest_rate(self, mock_get_rates):
-        mock_get_rates.return_value = RateInfo(
-            rate=120,
-            provider='Agoda',
-            code='AG'
-        )
+        mock_get_rates.return_value = AGODA_RATE
 
         result = updater.get_hotel_rates("test-key", "2026-03-01", "2026-03-02")
 
         assert result['rate'] == 120
         assert result['provider'] == 'Agoda'
 
-    @patch.object(XoteloAPI, 'get_rates')
     def test_returns_none_on_empty_rates(self, mock_get_rates):
         mock_get_rates.return_value = None
 
@@ -101,7 +94,6 @@ class TestGetHotelRates:
 
         assert result is None
 
-    @patch.object(XoteloAPI, 'get_rates')
     def test_returns_none_on_error_response(self, mock_get_rates):
         mock_get_rates.return_value = None
 
@@ -109,9 +101,8 @@ class TestGetHotelRates:
 
         assert result is None
 
-    @patch.object(XoteloAPI, 'get_rates')
     def test_passes_correct_params(self, mock_get_rates):
-        mock_get_rates.return_value = RateInfo(rate=100, provider='Test', code='T')
+        mock_get_rates.return_value = GENERIC_RATE
 
         updater.get_hotel_rates("my-key", "2026-03-01", "2026-03-02", rooms=2, adults=3)
 
@@ -1,91 +1,101 @@
 """
 Unit tests for xotelo_api.py - the shared API client module.
 """
+from unittest.mock import call
+
 import pytest
-import os
-import sys
-from unittest.mock import patch, MagicMock
+from requests.exceptions import Timeout
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from xotelo_api import XoteloAPI, RateInfo, HotelInfo
 
-from xotelo_api import XoteloAPI, RateInfo, HotelInfo, get_client
+# Canned API bodies shared by the tests below (read-only)
+RATES_PAYLOAD = {
+    'result': {
+        'rates': [
+            {'rate': 150, 'name': 'Booking.com', 'code': 'BK'},
+            {'rate': 120, 'name': 'Agoda', 'code': 'AG'},
+            {'rate': 180, 'name': 'Hotels.com', 'code': 'HT'}
+        ]
+    }
+}
+SEARCH_PAYLOAD = {
+    'result': {
+        'list': [
+            {'hotel_key': 'key1', 'name': 'Hotel One', 'short_place_name': 'San Juan'},
+            {'hotel_key': 'key2', 'name': 'Hotel Two', 'short_place_name': 'Ponce'}
+        ]
+    }
+}
+LIST_PAYLOAD = {
+    'result': {
+        'list': [
+            {'name': 'Hotel A', 'key': 'key-a'},
+            {'name': 'Hotel B', 'key': 'key-b'}
+        ],
+        'total_count': 100
+    }
+}
 
 
 class TestXoteloAPIInit:
     """Tests for XoteloAPI initialization."""
 
-    def test_default_initialization(self):
-        api = XoteloAPI()
-
-        assert api.base_url == "https://data.xotelo.com/api"
-        assert api.timeout == 30
-        assert api.delay == 0.5
-        assert api.max_retries == 2
+    def test_default_initialization(self, default_api):
+        assert default_api.base_url == "https://data.xotelo.com/api"
+        assert default_api.timeout == 30
+        assert default_api.delay == 0.5
+        assert default_api.max_retries == 2
+        assert default_api.retry_delay == 2.0
 
     def test_custom_initialization(self):
         api = XoteloAPI(
             base_url="https://custom.api.com",
             timeout=60,
             delay=1.0,
-            max_retries=5
+            max_retries=5,
+            retry_delay=0
         )
 
         assert api.base_url == "https://custom.api.com"
         assert api.timeout == 60
         assert api.delay == 1.0
         assert api.max_retries == 5
+        assert api.retry_delay == 0
 
 
 class TestXoteloAPIGetRates:
     """Tests for XoteloAPI.get_rates method."""
 
-    @patch.object(XoteloAPI, '_request')
-    def test_returns_lowest_rate(self, mock_request):
-        mock_request.return_value = {
-            'result': {
-                'rates': [
-                    {'rate': 150, 'name': 'Booking.com', 'code': 'BK'},
-                    {'rate': 120, 'name': 'Agoda', 'code': 'AG'},
-                    {'rate': 180, 'name': 'Hotels.com', 'code': 'HT'}
-                ]
-            }
-        }
+    def test_returns_lowest_rate(self, mock_request, default_api):
+        mock_request.return_value = RATES_PAYLOAD
 
-        api = XoteloAPI()
-        result = api.get_rates("test-key", "2026-03-01", "2026-03-02")
+        result = default_api.get_rates("test-key", "2026-03-01", "2026-03-02")
 
         assert result is not None
         assert result['rate'] == 120
         assert result['provider'] == 'Agoda'
         assert result['code'] == 'AG'
 
-    @patch.object(XoteloAPI, '_request')
-    def test_returns_none_on_empty_rates(self, mock_request):
+    def test_returns_none_on_empty_rates(self, mock_request, default_api):
         mock_request.return_value = {'result': {'rates': []}}
 
-        api = XoteloAPI()
-        result = api.get_rates("test-key", "2026-03-01", "2026-03-02")
+        result = default_api.get_rates("test-key", "2026-03-01", "2026-03-02")
 
         assert result is None
 
-    @patch.object(XoteloAPI, '_request')
-    def test_returns_none_on_api_failure(self, mock_request):
+    def test_returns_none_on_api_failure(self, mock_request, default_api):
         mock_request.return_value = None
 
-        api = XoteloAPI()
-        result = api.get_rates("test-key", "2026-03-01", "2026-03-02")
+        result = default_api.get_rates("test-key", "2026-03-01", "2026-03-02")
 
         assert result is None
 
-    @patch.object(XoteloAPI, '_request')
-    def test_passes_correct_params(self, mock_request):
+    def test_passes_correct_params(self, mock_request, default_api):
         mock_request.return_value = {
             'result': {'rates': [{'rate': 100, 'name': 'Test', 'code': 'T'}]}
         }
 
-        api = XoteloAPI()
-        api.get_rates("my-key", "2026-03-01", "2026-03-02", rooms=2, adults=3)
+        default_api.get_rates("my-key", "2026-03-01", "2026-03-02", rooms=2, adults=3)
 
         call_params = mock_request.call_args[0][1]
         assert call_params['hotel_key'] == 'my-key'
@@ -98,40 +108,27 @@ class TestXoteloAPIGetRates:
 class TestXoteloAPISearchHotel:
     """Tests for XoteloAPI.search_hotel method."""
 
-    @patch.object(XoteloAPI, '_request')
-    def test_returns_first_hotel_found(self, mock_request):
-        mock_request.return_value = {
-            'result': {
-                'list': [
-                    {'hotel_key': 'key1', 'name': 'Hotel One', 'short_place_name': 'San Juan'},
-                    {'hotel_key': 'key2', 'name': 'Hotel Two', 'short_place_name': 'Ponce'}
-                ]
-            }
-        }
+    def test_returns_first_hotel_found(self, mock_request, default_api):
+        mock_request.return_value = SEARCH_PAYLOAD
 
-        api = XoteloAPI()
-        result = api.search_hotel("Hotel")
+        result = default_api.search_hotel("Hotel")
 
         assert result is not None
         assert result['key'] == 'key1'
         assert result['name'] == 'Hotel One'
         assert result['location'] == 'San Juan'
 
-    @patch.object(XoteloAPI, '_request')
-    def test_returns_none_on_no_results(self, mock_request):
+    def test_returns_none_on_no_results(self, mock_request, default_api):
         mock_request.return_value = {'result': {'list': []}}
 
-        api = XoteloAPI()
-        result = api.search_hotel("NonexistentHotel")
+        result = default_api.search_hotel("NonexistentHotel")
 
         assert result is None
 
-    @patch.object(XoteloAPI, '_request')
-    def test_returns_none_on_api_failure(self, mock_request):
+    def test_returns_none_on_api_failure(self, mock_request, default_api):
         mock_request.return_value = None
 
-        api = XoteloAPI()
-        result = api.search_hotel("Hotel")
+        result = default_api.search_hotel("Hotel")
 
         assert result is None
 
@@ -139,41 +136,27 @@ class TestXoteloAPISearchHotel:
 class TestXoteloAPIListHotels:
     """Tests for XoteloAPI.list_hotels method."""
 
-    @patch.object(XoteloAPI, '_request')
-    def test_returns_hotels_and_count(self, mock_request):
-        mock_request.return_value = {
-            'result': {
-                'list': [
-                    {'name': 'Hotel A', 'key': 'key-a'},
-                    {'name': 'Hotel B', 'key': 'key-b'}
-                ],
-                'total_count': 100
-            }
-        }
+    def test_returns_hotels_and_count(self, mock_request, default_api):
+        mock_request.return_value = LIST_PAYLOAD
 
-        api = XoteloAPI()
-        hotels, total = api.list_hotels()
+        hotels, total = default_api.list_hotels()
 
         assert len(hotels) == 2
         assert total == 100
         assert hotels[0]['name'] == 'Hotel A'
 
-    @patch.object(XoteloAPI, '_request')
-    def test_returns_empty_on_api_failure(self, mock_request):
+    def test_returns_empty_on_api_failure(self, mock_request, default_api):
         mock_request.return_value = None
 
-        api = XoteloAPI()
-        hotels, total = api.list_hotels()
+        hotels, total = default_api.list_hotels()
 
         assert hotels == []
         assert total == 0
 
-    @patch.object(XoteloAPI, '_request')
-    def test_passes_pagination_params(self, mock_request):
+    def test_passes_pagination_params(self, mock_request, default_api):
         mock_request.return_value = {'result': {'list': [], 'total_count': 0}}
 
-        api = XoteloAPI()
-        api.list_hotels(location_key="custom-key", limit=50, offset=100)
+        default_api.list_hotels(location_key="custom-key", limit=50, offset=100)
 
         call_params = mock_request.call_args[0][1]
         assert call_params['location_key'] == 'custom-key'
@@ -184,89 +167,64 @@ class TestXoteloAPIListHotels:
 class TestXoteloAPIRequest:
     """Tests for XoteloAPI._request method (internal)."""
 
-    @patch('xotelo_api.requests.Session.get')
-    def test_returns_data_on_success(self, mock_get):
-        mock_response = MagicMock()
-        mock_response.json.return_value = {'result': {'data': 'test'}}
-        mock_response.raise_for_status = MagicMock()
-        mock_get.return_value = mock_response
+    def test_returns_data_on_success(self, mock_session_get, default_api, fake_response):
+        mock_session_get.return_value = fake_response({'result': {'data': 'test'}})
 
-        api = XoteloAPI()
-        result = api._request('/test', {'param': 'value'})
+        result = default_api._request('/test', {'param': 'value'})
 
         assert result == {'result': {'data': 'test'}}
 
-    @patch('xotelo_api.requests.Session.get')
-    def test_returns_none_on_error_response(self, mock_get):
-        mock_response = MagicMock()
-        mock_response.json.return_value = {'error': 'Something went wrong'}
-        mock_response.raise_for_status = MagicMock()
-        mock_get.return_value = mock_response
+    def test_returns_none_on_error_response(self, mock_session_get, default_api, fake_response):
+        mock_session_get.return_value = fake_response({'error': 'Something went wrong'})
 
-        api = XoteloAPI()
-        result = api._request('/test', {})
+        result = default_api._request('/test', {})
 
         assert result is None
 
-    @patch('xotelo_api.requests.Session.get')
-    @patch('xotelo_api.time.sleep')
-    def test_retries_on_timeout(self, mock_sleep, mock_get):
-        import requests
-        mock_get.side_effect = [
-            requests.exceptions.Timeout(),
-            MagicMock(
-                json=MagicMock(return_value={'result': 'success'}),
-                raise_for_status=MagicMock()
-            )
-        ]
-
-        api = XoteloAPI(max_retries=2)
-        result = api._request('/test', {})
-
-        assert result == {'result': 'success'}
-        assert mock_get.call_count == 2
-
-    @patch('xotelo_api.requests.Session.get')
-    @patch('xotelo_api.time.sleep')
-    def test_returns_none_after_max_retries(self, mock_sleep, mock_get):
-        import requests
-        mock_get.side_effect = requests.exceptions.Timeout()
+    @pytest.mark.parametrize("max_retries,timeouts,expected", [
+        pytest.param(2, 1, {'result': 'success'}, id="recovers_after_timeout"),
+        pytest.param(3, 3, None, id="gives_up_after_max_retries"),
+    ])
+    def test_retry_behavior(
+        self, no_sleep, mock_session_get, fake_response, max_retries, timeouts, expected
+    ):
+        mock_session_get.side_effect = (
+            [Timeout()] * timeouts + [fake_response({'result': 'success'})]
+        )
 
-        api = XoteloAPI(max_retries=3)
+        api = XoteloAPI(max_retries=max_retries, retry_delay=0.25)
         result = api._request('/test', {})
 
-        assert result is None
-        assert mock_get.call_count == 3
+        attempts = min(timeouts + 1, max_retries)
+        assert result == expected
+        assert mock_session_get.call_count == attempts
+        assert no_sleep.call_args_list == [call(0.25)] * (attempts - 1)
 
 
 class TestXoteloAPIWait:
     """Tests for XoteloAPI.wait method."""
 
-    @patch('xotelo_api.time.sleep')
-    def test_sleeps_for_configured_delay(self, mock_sleep):
+    def test_sleeps_for_configured_delay(self, no_sleep):
         api = XoteloAPI(delay=1.5)
         api.wait()
 
-        mock_sleep.assert_called_once_with(1.5)
+        no_sleep.assert_called_once_with(1.5)
 
 
 class TestGetClient:
     """Tests for get_client convenience function."""
 
-    def test_returns_xotelo_api_instance(self):
-        # Reset the cached client
+    @pytest.fixture
+    def fresh_client_module(self, monkeypatch):
+        """xotelo_api with the cached client cleared (restored on teardown)."""
         import xotelo_api
-        xotelo_api._default_client = None
+        monkeypatch.setattr(xotelo_api, "_default_client", None)
+        return xotelo_api
 
-        client = get_client()
+    def test_returns_xotelo_api_instance(self, fresh_client_module):
+        client = fresh_client_module.get_client()
 
         assert isinstance(client, XoteloAPI)
 
-    def test_returns_same_instance_on_subsequent_calls(self):
-        import xotelo_api
-        xotelo_api._default_client = None
-
-        client1 = get_client()
-        client2 = get_client()
-
-        assert client1 is client2
+    def test_returns_same_instance_on_subsequent_calls(self, fresh_client_module):
+        assert fresh_client_module.get_client() is fresh_client_module.get_client()
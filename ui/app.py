@@ -4,20 +4,28 @@ Interfaz gráfica de escritorio usando CustomTkinter.
 """
 
 import logging
+import os
 import sys
+import threading
+import weakref
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Tuple
 
 import customtkinter as ctk
 from PIL import Image
 
+from ui.utils._version import APP_VERSION
 from ui.utils.icons import get_icon
-from ui.utils.theme import TAMANOS, TemaMode, aplicar_tema, obtener_fuente
+from ui.utils.theme import TAMANOS, TemaMode, aplicar_modo, aplicar_tema, obtener_fuente
 from ui.utils.tooltip import ToolTip
 
 logger = logging.getLogger(__name__)
 
 
+# Application root: PyInstaller bundle dir, or the repo root in development
+_BASE_PATH: Path = Path(getattr(sys, '_MEIPASS', Path(__file__).parent.parent))
+
+
 def get_resource_path(relative_path: str) -> Path:
     """
     Get absolute path to resource, works for dev and PyInstaller bundle.
@@ -28,13 +36,7 @@ def get_resource_path(relative_path: str) -> Path:
     Returns:
         Absolute path to the resource.
     """
-    if hasattr(sys, '_MEIPASS'):
-        # Running as PyInstaller bundle
-        base_path = Path(sys._MEIPASS)
-    else:
-        # Running in development
-        base_path = Path(__file__).parent.parent
-    return base_path / relative_path
+    return _BASE_PATH / relative_path
 
 
 class HotelPriceApp(ctk.CTk):
@@ -53,9 +55,21 @@ class HotelPriceApp(ctk.CTk):
     ANCHO_MINIMO: int = 1000
     ALTO_MINIMO: int = 600
 
-    # Altura del logo (el path se calcula dinámicamente para PyInstaller)
+    # Retardo del chequeo de actualizaciones: su import (requests) compite
+    # por el GIL con el primer pintado si arranca inmediatamente
+    RETARDO_CHEQUEO_UPDATES_MS: int = 100
+
+    # Logo (get_resource_path resuelve el path también dentro de PyInstaller)
+    LOGO_PATH: Path = get_resource_path("ui/assets/fpr_logo.png")
     LOGO_HEIGHT: int = 35
 
+    # Logo decodificado y reducido una sola vez por proceso (None = no existe
+    # el archivo). Se guarda la imagen PIL, no el CTkImage: este crea
+    # PhotoImages ligados a la raíz Tk que lo renderiza primero.
+    _logo_pil: Optional[Image.Image] = None
+    _logo_size: Tuple[int, int] = (0, 0)
+    _logo_cargado: bool = False
+
     # Tab names (clean text — icons are on buttons, not tab labels)
     PESTANAS: Dict[str, str] = {
         "api_keys": "API Keys",
@@ -63,6 +77,19 @@ class HotelPriceApp(ctk.CTk):
         "ejecutar": "Execute",
         "resultados": "Results",
     }
+    # Título -> nombre interno (para obtener_pestana_actual)
+    PESTANAS_POR_TITULO: Dict[str, str] = {v: k for k, v in PESTANAS.items()}
+
+    # Atajos de teclado: (tecla, método, argumentos); el modificador
+    # Cmd/Ctrl se resuelve en _configurar_atajos
+    ATAJOS: Tuple[Tuple[str, str, Tuple[str, ...]], ...] = (
+        ("o", "_atajo_cargar_excel", ()),
+        ("s", "_atajo_guardar_excel", ()),
+        ("Key-1", "cambiar_pestana", ("api_keys",)),
+        ("Key-2", "cambiar_pestana", ("hoteles",)),
+        ("Key-3", "cambiar_pestana", ("ejecutar",)),
+        ("Key-4", "cambiar_pestana", ("resultados",)),
+    )
 
     def __init__(self) -> None:
         """Inicializa la aplicación principal."""
@@ -79,11 +106,21 @@ class HotelPriceApp(ctk.CTk):
         # Estado inicial
         self.modo_tema: TemaMode = "dark"
 
-        # Referencias a las pestañas
+        # Referencias a las pestañas (se construyen al primer uso)
         self.tab_api_keys: Optional[Any] = None
         self.tab_hoteles: Optional[Any] = None
         self.tab_ejecutar: Optional[Any] = None
         self.tab_resultados: Optional[Any] = None
+        self._tab_factories: Dict[str, Callable[[ctk.CTkFrame], Optional[Any]]] = {
+            "api_keys": self._crear_tab_api_keys,
+            "hoteles": self._crear_tab_hoteles,
+            "ejecutar": self._crear_tab_ejecutar,
+            "resultados": self._crear_tab_resultados,
+        }
+        self._tab_instances: Dict[str, Optional[Any]] = {}
+
+        # Updater (se crea en el primer chequeo de actualizaciones)
+        self._updater: Optional[Any] = None
 
         # Configurar ventana
         self._configurar_ventana()
@@ -91,31 +128,31 @@ class HotelPriceApp(ctk.CTk):
         # Aplicar tema inicial
         aplicar_tema(self.modo_tema)
 
-        # Crear interfaz
+        # Crear interfaz (solo el esqueleto; el contenido va tras el primer pintado)
         self._crear_barra_superior()
         self._crear_tabview()
-        self._crear_contenido_pestanas()
-
-        # Auto-cargar hotel database si existe
-        self._cargar_database_inicial()
-
-        # Check for updates (async, non-blocking)
-        self._check_for_updates()
 
         # Keyboard shortcuts
         self._configurar_atajos()
 
+        # Contenido cuando el loop queda libre; updater un poco después
+        self.after_idle(self._post_paint_init)
+        self.after(self.RETARDO_CHEQUEO_UPDATES_MS, self._check_for_updates)
+
+    def _post_paint_init(self) -> None:
+        """Inicialización diferida: corre cuando el loop ya pintó la ventana."""
+        self._crear_contenido_pestanas()
+
     def _configurar_atajos(self) -> None:
         """Configura atajos de teclado globales."""
         # Cmd/Ctrl modifier según plataforma
         mod = "Command" if sys.platform == "darwin" else "Control"
 
-        self.bind_all(f"<{mod}-o>", lambda e: self._atajo_cargar_excel())
-        self.bind_all(f"<{mod}-s>", lambda e: self._atajo_guardar_excel())
-        self.bind_all(f"<{mod}-Key-1>", lambda e: self.cambiar_pestana("api_keys"))
-        self.bind_all(f"<{mod}-Key-2>", lambda e: self.cambiar_pestana("hoteles"))
-        self.bind_all(f"<{mod}-Key-3>", lambda e: self.cambiar_pestana("ejecutar"))
-        self.bind_all(f"<{mod}-Key-4>", lambda e: self.cambiar_pestana("resultados"))
+        for tecla, metodo, args in self.ATAJOS:
+            self.bind_all(
+                f"<{mod}-{tecla}>",
+                lambda e, f=getattr(self, metodo), a=args: f(*a),
+            )
 
     def _atajo_cargar_excel(self) -> None:
         """Atajo Cmd/Ctrl+O: abre Excel en pestaña Hotels."""
@@ -131,25 +168,19 @@ class HotelPriceApp(ctk.CTk):
     def _configurar_ventana(self) -> None:
         """Configura las propiedades de la ventana principal."""
         self.title(self.TITULO_APP)
-        self.geometry(f"{self.ANCHO_VENTANA}x{self.ALTO_VENTANA}")
         self.minsize(self.ANCHO_MINIMO, self.ALTO_MINIMO)
 
-        # Centrar ventana en pantalla
-        self._centrar_ventana()
+        # Tamaño y posición centrada en una sola llamada a geometry().
+        # winfo_screen* consulta el display directamente; no hace falta
+        # update_idletasks() (forzaría un pase de layout antes de pintar)
+        x = (self.winfo_screenwidth() - self.ANCHO_VENTANA) // 2
+        y = (self.winfo_screenheight() - self.ALTO_VENTANA) // 2
+        self.geometry(f"{self.ANCHO_VENTANA}x{self.ALTO_VENTANA}+{x}+{y}")
 
         # Configurar grid
         self.grid_columnconfigure(0, weight=1)
         self.grid_rowconfigure(1, weight=1)
 
-    def _centrar_ventana(self) -> None:
-        """Centra la ventana en la pantalla."""
-        self.update_idletasks()
-        ancho_pantalla = self.winfo_screenwidth()
-        alto_pantalla = self.winfo_screenheight()
-        x = (ancho_pantalla - self.ANCHO_VENTANA) // 2
-        y = (alto_pantalla - self.ALTO_VENTANA) // 2
-        self.geometry(f"{self.ANCHO_VENTANA}x{self.ALTO_VENTANA}+{x}+{y}")
-
     def _crear_barra_superior(self) -> None:
         """Crea la barra superior con logo, título y toggle de tema."""
         # Frame de la barra superior
@@ -158,31 +189,18 @@ class HotelPriceApp(ctk.CTk):
         self.barra_superior.grid_columnconfigure(1, weight=1)
 
         # Logo de FPR
-        logo_path = get_resource_path("ui/assets/fpr_logo.png")
-        if logo_path.exists():
-            logo_img = Image.open(logo_path)
-            # Calcular ancho proporcional
-            aspect_ratio = logo_img.width / logo_img.height
-            logo_width = int(self.LOGO_HEIGHT * aspect_ratio)
-            self.logo_image = ctk.CTkImage(
-                light_image=logo_img,
-                dark_image=logo_img,
-                size=(logo_width, self.LOGO_HEIGHT),
-            )
+        self.logo_image = self._get_logo()
+        if self.logo_image is not None:
             self.label_logo = ctk.CTkLabel(
                 self.barra_superior, image=self.logo_image, text=""
             )
             self.label_logo.grid(row=0, column=0, padx=(TAMANOS["padding_grande"], 10), pady=8)
 
-        # Título con versión integrada
-        try:
-            from ui.utils.updater import APP_VERSION
-            titulo_texto = f"{self.TITULO_APP}  v{APP_VERSION}"
-        except ImportError:
-            titulo_texto = self.TITULO_APP
-
+        # Título con versión
         self.label_titulo = ctk.CTkLabel(
-            self.barra_superior, text=titulo_texto, font=obtener_fuente("subtitulo")
+            self.barra_superior,
+            text=f"{self.TITULO_APP}  v{APP_VERSION}",
+            font=obtener_fuente("subtitulo"),
         )
         self.label_titulo.grid(row=0, column=1, padx=0, pady=10, sticky="w")
 
@@ -215,9 +233,55 @@ class HotelPriceApp(ctk.CTk):
         self.btn_tema.grid(row=0, column=3, padx=TAMANOS["padding_grande"], pady=10)
         ToolTip(self.btn_tema, "Toggle dark/light mode")
 
+    @classmethod
+    def _cargar_logo_pil(cls) -> Optional[Image.Image]:
+        """
+        Devuelve el logo como imagen PIL, decodificando el PNG solo la primera vez.
+
+        Con HOTEL_APP_NO_LOGO=1 (CI, builds headless) no se toca el disco.
+
+        Returns:
+            Imagen PIL del logo, o None si el archivo no existe o está desactivado.
+        """
+        if not cls._logo_cargado:
+            if os.getenv("HOTEL_APP_NO_LOGO") != "1" and cls.LOGO_PATH.is_file():
+                logo_img = Image.open(cls.LOGO_PATH)
+                # Calcular ancho proporcional
+                aspect_ratio = logo_img.width / logo_img.height
+                logo_width = int(cls.LOGO_HEIGHT * aspect_ratio)
+                # Reducir una vez a 2x (retina) para que CTkImage no re-escale
+                # el PNG original en cada cambio de tema o de DPI
+                render_size = (logo_width * 2, cls.LOGO_HEIGHT * 2)
+                if logo_img.width > render_size[0]:
+                    logo_img = logo_img.resize(render_size, Image.LANCZOS)
+                cls._logo_pil = logo_img
+                cls._logo_size = (logo_width, cls.LOGO_HEIGHT)
+            cls._logo_cargado = True
+        return cls._logo_pil
+
+    def _get_logo(self) -> Optional[ctk.CTkImage]:
+        """
+        Crea el CTkImage del logo para esta ventana a partir de la imagen cacheada.
+
+        Returns:
+            CTkImage del logo, o None si no hay logo.
+        """
+        logo_img = self._cargar_logo_pil()
+        if logo_img is None:
+            return None
+        return ctk.CTkImage(
+            light_image=logo_img,
+            dark_image=logo_img,
+            size=self._logo_size,
+        )
+
     def _crear_tabview(self) -> None:
         """Crea el widget de pestañas principal."""
-        self.tabview = ctk.CTkTabview(self, corner_radius=TAMANOS["radio_borde"])
+        self.tabview = ctk.CTkTabview(
+            self,
+            corner_radius=TAMANOS["radio_borde"],
+            command=self._on_tab_changed,
+        )
         self.tabview.grid(
             row=1,
             column=0,
@@ -226,120 +290,212 @@ class HotelPriceApp(ctk.CTk):
             pady=(0, TAMANOS["padding_grande"]),
         )
 
-        # Agregar pestañas
-        for nombre_interno, titulo in self.PESTANAS.items():
+        # Agregar pestañas (Tk difiere el layout al idle: no hace falta
+        # ocultar el segmented button mientras se agregan)
+        for titulo in self.PESTANAS.values():
             self.tabview.add(titulo)
 
     def _crear_contenido_pestanas(self) -> None:
-        """Crea el contenido de cada pestaña."""
+        """
+        Crea el contenido de la pestaña visible al arrancar.
+
+        Las demás pestañas se construyen la primera vez que se seleccionan
+        o se necesitan (ver _asegurar_pestana), así el arranque solo paga
+        por la pestaña que se ve.
+        """
+        nombre = self.obtener_pestana_actual()
+        if nombre:
+            self._asegurar_pestana(nombre)
+
+    def _on_tab_changed(self) -> None:
+        """Construye la pestaña recién seleccionada si aún no existe."""
+        nombre = self.obtener_pestana_actual()
+        if nombre:
+            self._asegurar_pestana(nombre)
+
+    def _asegurar_pestana(self, nombre: str) -> Optional[Any]:
+        """
+        Devuelve la pestaña indicada, construyéndola en su frame si hace falta.
+
+        Args:
+            nombre: Nombre interno de la pestaña.
+
+        Returns:
+            Widget de la pestaña, o None si no se pudo importar.
+        """
+        if nombre in self._tab_instances:
+            return self._tab_instances[nombre]
+
+        tab = self._montar_pestana(nombre, self._tab_factories[nombre])
+        self._tab_instances[nombre] = tab
+        setattr(self, f"tab_{nombre}", tab)
+        return tab
+
+    def _montar_pestana(
+        self, nombre: str, factory: Callable[[ctk.CTkFrame], Optional[Any]]
+    ) -> Optional[Any]:
+        """
+        Prepara el frame de una pestaña y coloca en él el widget de la factory.
+
+        Args:
+            nombre: Nombre interno de la pestaña.
+            factory: Callable que recibe el frame y devuelve el widget (o None).
+
+        Returns:
+            Widget creado por la factory, o None.
+        """
+        frame = self.tabview.tab(self.PESTANAS[nombre])
+        frame.grid_columnconfigure(0, weight=1)
+        frame.grid_rowconfigure(0, weight=1)
+        # El tabview fija el tamaño del frame; que los hijos no lo re-propaguen
+        frame.grid_propagate(False)
+
+        tab = factory(frame)
+        if tab is not None:
+            tab.grid(row=0, column=0, sticky="nsew")
+        return tab
+
+    def _crear_tab_api_keys(self, frame: ctk.CTkFrame) -> Any:
+        """Construye la pestaña API Keys."""
         # Importar tabs aquí para evitar imports circulares
         from ui.tabs.api_keys_tab import ApiKeysTab
+
+        return ApiKeysTab(frame)
+
+    def _crear_tab_hoteles(self, frame: ctk.CTkFrame) -> Any:
+        """Construye la pestaña Hoteles."""
         from ui.tabs.hotels_tab import HotelsTab
 
-        # Pestaña API Keys
-        tab_api_keys_frame = self.tabview.tab(self.PESTANAS["api_keys"])
-        tab_api_keys_frame.grid_columnconfigure(0, weight=1)
-        tab_api_keys_frame.grid_rowconfigure(0, weight=1)
-        self.tab_api_keys = ApiKeysTab(tab_api_keys_frame)
-        self.tab_api_keys.grid(row=0, column=0, sticky="nsew")
-
-        # Pestaña Hoteles
-        tab_hoteles_frame = self.tabview.tab(self.PESTANAS["hoteles"])
-        tab_hoteles_frame.grid_columnconfigure(0, weight=1)
-        tab_hoteles_frame.grid_rowconfigure(0, weight=1)
-        self.tab_hoteles = HotelsTab(tab_hoteles_frame)
-        self.tab_hoteles.grid(row=0, column=0, sticky="nsew")
-
-        # Pestaña Ejecutar
-        tab_ejecutar_frame = self.tabview.tab(self.PESTANAS["ejecutar"])
-        tab_ejecutar_frame.grid_columnconfigure(0, weight=1)
-        tab_ejecutar_frame.grid_rowconfigure(0, weight=1)
+        tab = HotelsTab(frame)
+        # Avisar si falta el cache de hoteles de Xotelo
+        if hasattr(tab, "mostrar_aviso_cache_faltante"):
+            tab.mostrar_aviso_cache_faltante()
+        return tab
+
+    def _crear_tab_ejecutar(self, frame: ctk.CTkFrame) -> Optional[Any]:
+        """Construye la pestaña Ejecutar (placeholder si falla el import)."""
         try:
             from ui.tabs.execute_tab import ExecuteTab
-
-            self.tab_ejecutar = ExecuteTab(
-                tab_ejecutar_frame,
-                modo_tema=self.modo_tema,
-                obtener_hoteles=self._obtener_hoteles_para_busqueda,
-                on_busqueda_completada=self._on_busqueda_completada,
-            )
-            self.tab_ejecutar.grid(row=0, column=0, sticky="nsew")
         except ImportError as e:
-            label_placeholder = ctk.CTkLabel(
-                tab_ejecutar_frame,
-                text=f"Pestaña Ejecutar\n\n(Error: {e})",
-                font=obtener_fuente("encabezado"),
-            )
-            label_placeholder.grid(row=0, column=0, pady=50)
+            self._mostrar_placeholder(frame, "Ejecutar", e)
+            return None
+
+        return ExecuteTab(
+            frame,
+            modo_tema=self.modo_tema,
+            obtener_hoteles=self._obtener_hoteles_para_busqueda,
+            on_busqueda_completada=self._on_busqueda_completada,
+        )
 
-        # Pestaña Resultados
-        tab_resultados_frame = self.tabview.tab(self.PESTANAS["resultados"])
-        tab_resultados_frame.grid_columnconfigure(0, weight=1)
-        tab_resultados_frame.grid_rowconfigure(0, weight=1)
+    def _crear_tab_resultados(self, frame: ctk.CTkFrame) -> Optional[Any]:
+        """Construye la pestaña Resultados (placeholder si falla el import)."""
         try:
             from ui.tabs.results_tab import ResultsTab
-
-            self.tab_resultados = ResultsTab(
-                tab_resultados_frame,
-                modo_tema=self.modo_tema,
-            )
-            self.tab_resultados.grid(row=0, column=0, sticky="nsew")
         except ImportError as e:
-            label_placeholder = ctk.CTkLabel(
-                tab_resultados_frame,
-                text=f"Pestaña Resultados\n\n(Error: {e})",
-                font=obtener_fuente("encabezado"),
-            )
-            label_placeholder.grid(row=0, column=0, pady=50)
+            self._mostrar_placeholder(frame, "Resultados", e)
+            return None
 
-    def _cargar_database_inicial(self) -> None:
-        """
-        Verifica el estado inicial y muestra avisos necesarios.
+        return ResultsTab(frame, modo_tema=self.modo_tema)
 
-        - Verifica si existe el cache de hoteles de Xotelo
-        - Muestra aviso si falta el cache
-        """
-        if self.tab_hoteles:
-            # Verificar si existe el cache de hoteles PR
-            if hasattr(self.tab_hoteles, "mostrar_aviso_cache_faltante"):
-                self.tab_hoteles.mostrar_aviso_cache_faltante()
+    def _mostrar_placeholder(self, frame: ctk.CTkFrame, titulo: str, error: Exception) -> None:
+        """Muestra un aviso en lugar de una pestaña que no se pudo cargar."""
+        label_placeholder = ctk.CTkLabel(
+            frame,
+            text=f"Pestaña {titulo}\n\n(Error: {error})",
+            font=obtener_fuente("encabezado"),
+        )
+        label_placeholder.grid(row=0, column=0, pady=50)
 
     def _check_for_updates(self) -> None:
         """
         Check for application updates asynchronously.
 
-        Shows a dialog if an update is available.
+        The updater imports (requests, packaging) run on a worker thread so
+        they never block the Tk event loop. Shows a dialog if an update is
+        available.
         """
-        try:
-            from ui.utils.updater import get_updater, UpdateInfo
-            from ui.components.update_dialog import show_update_dialog
-
-            updater = get_updater()
-
-            def on_update_available(info: UpdateInfo) -> None:
-                """Called when an update is found."""
-                logger.info(f"Update available: {info.version}")
-                # Show dialog on main thread
-                self.after(0, lambda: show_update_dialog(self, info))
-
-            def on_no_update() -> None:
-                """Called when no update is available."""
-                logger.debug("No update available")
-
-            def on_error(error: str) -> None:
-                """Called when update check fails."""
-                logger.warning(f"Update check failed: {error}")
-
-            # Check for updates in background
-            updater.check_for_update(
-                on_update_available=on_update_available,
-                on_no_update=on_no_update,
-                on_error=on_error,
-            )
+        threading.Thread(target=self._check_for_updates_worker, daemon=True).start()
 
+    def _check_for_updates_worker(self) -> None:
+        """Worker thread body for _check_for_updates (no Tk access here)."""
+        try:
+            self._run_update_check()
         except ImportError as e:
             logger.warning(f"Could not import updater: {e}")
 
+    def _run_update_check(
+        self,
+        on_ui_done: Optional[Callable[["HotelPriceApp"], None]] = None,
+        on_ui_no_update: Optional[Callable[["HotelPriceApp"], None]] = None,
+        on_ui_error: Optional[Callable[["HotelPriceApp", str], None]] = None,
+    ) -> None:
+        """
+        Start an update check shared by the automatic and manual paths.
+
+        The update dialog is always shown when an update is found; the
+        optional hooks customize the remaining UI reactions and are run
+        on the Tk thread with the app as first argument.
+
+        The updater only holds a weak reference to the app, so a window
+        closed during a slow request can be freed and its callbacks become
+        no-ops.
+
+        Args:
+            on_ui_done: Called once the check finishes, whatever the outcome.
+            on_ui_no_update: Called when no update is available.
+            on_ui_error: Called with the error message if the check fails.
+
+        Raises:
+            ImportError: If the updater or its dependencies are unavailable.
+        """
+        from ui.utils.updater import get_updater, UpdateInfo
+        from ui.components.update_dialog import show_update_dialog
+
+        if self._updater is None:
+            self._updater = get_updater()
+
+        app_ref = weakref.ref(self)
+
+        def on_update_available(info: UpdateInfo) -> None:
+            """Called when an update is found."""
+            logger.info(f"Update available: {info.version}")
+            app = app_ref()
+            if app is None:
+                return
+            if on_ui_done:
+                app.after(0, on_ui_done, app)
+            # Show dialog on main thread
+            app.after(0, show_update_dialog, app, info)
+
+        def on_no_update() -> None:
+            """Called when no update is available."""
+            logger.debug("No update available")
+            app = app_ref()
+            if app is None:
+                return
+            if on_ui_done:
+                app.after(0, on_ui_done, app)
+            if on_ui_no_update:
+                app.after(0, on_ui_no_update, app)
+
+        def on_error(error: str) -> None:
+            """Called when update check fails."""
+            logger.warning(f"Update check failed: {error}")
+            app = app_ref()
+            if app is None:
+                return
+            if on_ui_done:
+                app.after(0, on_ui_done, app)
+            if on_ui_error:
+                app.after(0, on_ui_error, app, error)
+
+        # Check for updates in background
+        self._updater.check_for_update(
+            on_update_available=on_update_available,
+            on_no_update=on_no_update,
+            on_error=on_error,
+        )
+
     def _obtener_hoteles_para_busqueda(self):
         """
         Callback para obtener la lista de hoteles desde la pestaña Hoteles.
@@ -347,8 +503,10 @@ class HotelPriceApp(ctk.CTk):
         Returns:
             Lista de hoteles para búsqueda.
         """
-        if self.tab_hoteles:
-            return self.tab_hoteles.obtener_hoteles()
+        # Construir Hoteles si el usuario aún no la abrió
+        tab_hoteles = self._asegurar_pestana("hoteles")
+        if tab_hoteles:
+            return tab_hoteles.obtener_hoteles()
         return []
 
     def _on_busqueda_completada(self, resultados: list):
@@ -358,7 +516,8 @@ class HotelPriceApp(ctk.CTk):
         Args:
             resultados: Lista de resultados de la búsqueda.
         """
-        # Pasar resultados a la pestaña de resultados
+        # Pasar resultados a la pestaña de resultados (construirla si aún no existe)
+        self._asegurar_pestana("resultados")
         if self.tab_resultados and hasattr(self.tab_resultados, "cargar_resultados"):
             self.tab_resultados.cargar_resultados(resultados)
             # Cambiar a la pestaña de resultados
@@ -368,59 +527,50 @@ class HotelPriceApp(ctk.CTk):
         """Manually check for updates and show result."""
         from tkinter import messagebox
 
+        self.btn_updates.configure(state="disabled")
         try:
-            from ui.utils.updater import get_updater, UpdateInfo
-            from ui.components.update_dialog import show_update_dialog
-
-            self.btn_updates.configure(state="disabled")
-            updater = get_updater()
-
-            def on_update_available(info: UpdateInfo) -> None:
-                self.after(0, lambda: self.btn_updates.configure(state="normal"))
-                self.after(0, lambda: show_update_dialog(self, info))
-
-            def on_no_update() -> None:
-                self.after(0, lambda: self.btn_updates.configure(state="normal"))
-                self.after(0, lambda: messagebox.showinfo(
+            # Los hooks reciben la app: no capturan self (ver _run_update_check)
+            self._run_update_check(
+                on_ui_done=lambda app: app.btn_updates.configure(state="normal"),
+                on_ui_no_update=lambda app: messagebox.showinfo(
                     "No Updates",
-                    f"You're running the latest version ({updater.get_current_version()}).",
-                    parent=self
-                ))
-
-            def on_error(error: str) -> None:
-                self.after(0, lambda: self.btn_updates.configure(state="normal"))
-                self.after(0, lambda: messagebox.showerror(
+                    f"You're running the latest version ({app._updater.get_current_version()}).",
+                    parent=app
+                ),
+                on_ui_error=lambda app, error: messagebox.showerror(
                     "Update Check Failed",
                     f"Could not check for updates:\n\n{error}",
-                    parent=self
-                ))
-
-            updater.check_for_update(
-                on_update_available=on_update_available,
-                on_no_update=on_no_update,
-                on_error=on_error,
+                    parent=app
+                ),
             )
-
         except ImportError as e:
             self.btn_updates.configure(state="normal")
             messagebox.showerror("Error", f"Updater not available: {e}", parent=self)
 
     def _alternar_tema(self) -> None:
         """Alterna entre modo oscuro y claro."""
-        if self.modo_tema == "dark":
-            self.modo_tema = "light"
-            self.btn_tema.configure(image=get_icon("sun"))
-        else:
-            self.modo_tema = "dark"
-            self.btn_tema.configure(image=get_icon("moon"))
+        self.cambiar_tema("light" if self.modo_tema == "dark" else "dark")
 
-        aplicar_tema(self.modo_tema)
+    def cambiar_tema(self, modo: TemaMode) -> None:
+        """
+        Cambia el modo de tema; no hace nada si ya es el modo activo.
+
+        Args:
+            modo: "dark" o "light".
+        """
+        if modo == self.modo_tema:
+            return
 
-        # Propagar tema a pestañas que manejan colores propios
+        self.modo_tema = modo
+        self.btn_tema.configure(image=get_icon("sun" if modo == "light" else "moon"))
+        aplicar_modo(modo)
+
+        # Propagar tema a pestañas ya construidas que manejan colores propios
+        # (las demás lo reciben por modo_tema al crearse)
         if self.tab_ejecutar and hasattr(self.tab_ejecutar, 'cambiar_tema'):
-            self.tab_ejecutar.cambiar_tema(self.modo_tema)
+            self.tab_ejecutar.cambiar_tema(modo)
         if self.tab_resultados and hasattr(self.tab_resultados, 'cambiar_tema'):
-            self.tab_resultados.cambiar_tema(self.modo_tema)
+            self.tab_resultados.cambiar_tema(modo)
 
     def cambiar_pestana(self, nombre: str) -> None:
         """
@@ -430,15 +580,19 @@ class HotelPriceApp(ctk.CTk):
             nombre: Nombre interno de la pestaña ("api_keys", "hoteles",
                    "ejecutar", "resultados").
         """
-        if nombre in self.PESTANAS:
-            titulo = self.PESTANAS[nombre]
-            self.tabview.set(titulo)
-        else:
+        titulo = self.PESTANAS.get(nombre)
+        if titulo is None:
             raise ValueError(
                 f"Pestaña '{nombre}' no existe. "
                 f"Opciones válidas: {list(self.PESTANAS.keys())}"
             )
 
+        # tabview.set() no dispara el command del tabview
+        self._asegurar_pestana(nombre)
+        # Ya está visible: evitar el re-grid de frames en CTkTabview.set
+        if self.tabview.get() != titulo:
+            self.tabview.set(titulo)
+
     def obtener_pestana_actual(self) -> str:
         """
         Obtiene el nombre interno de la pestaña actual.
@@ -446,11 +600,7 @@ class HotelPriceApp(ctk.CTk):
         Returns:
             Nombre interno de la pestaña activa.
         """
-        titulo_actual = self.tabview.get()
-        for nombre, titulo in self.PESTANAS.items():
-            if titulo == titulo_actual:
-                return nombre
-        return ""
+        return self.PESTANAS_POR_TITULO.get(self.tabview.get(), "")
 
     def obtener_frame_pestana(self, nombre: str) -> ctk.CTkFrame:
         """
@@ -441,74 +441,76 @@ class ExecuteTab(ctk.CTkFrame):
 
             total = len(hoteles)
 
-            for i, hotel in enumerate(hoteles):
-                if self._cancelar:
-                    self._queue.put(
-                        ("log", "Search cancelled by user", "warning")
-                    )
-                    break
+            # Un solo guardado del cache al terminar el lote
+            with cache.buffered():
+                for i, hotel in enumerate(hoteles):
+                    if self._cancelar:
+                        self._queue.put(
+                            ("log", "Search cancelled by user", "warning")
+                        )
+                        break
 
-                nombre = hotel.get("nombre", "Unknown hotel")
-                key = hotel.get("xotelo_key", "")
-                booking_url = hotel.get("booking_url", "")
+                    nombre = hotel.get("nombre", "Unknown hotel")
+                    key = hotel.get("xotelo_key", "")
+                    booking_url = hotel.get("booking_url", "")
 
-                self._queue.put(("log", f"Searching: {nombre}...", "info"))
-                self._queue.put(("progress", i, total))
+                    self._queue.put(("log", f"Searching: {nombre}...", "info"))
+                    self._queue.put(("progress", i, total))
 
-                try:
-                    result = cascade.get_price(
-                        hotel_name=nombre,
-                        hotel_key=key if key else None,
-                        check_in=check_in,
-                        check_out=check_out,
-                        rooms=habitaciones,
-                        adults=adultos,
-                        booking_url=booking_url if booking_url else None,
-                    )
-
-                    if result:
-                        precio = result.get("price", 0)
-                        proveedor = result.get("provider", "unknown")
+                    try:
+                        result = cascade.get_price(
+                            hotel_name=nombre,
+                            hotel_key=key if key else None,
+                            check_in=check_in,
+                            check_out=check_out,
+                            rooms=habitaciones,
+                            adults=adultos,
+                            booking_url=booking_url if booking_url else None,
+                        )
 
-                        self._queue.put(
-                            (
-                                "log",
-                                f"✓ {nombre}: ${precio:.2f} (via {proveedor})",
-                                "success",
+                        if result:
+                            precio = result.get("price", 0)
+                            proveedor = result.get("provider", "unknown")
+
+                            self._queue.put(
+                                (
+                                    "log",
+                                    f"✓ {nombre}: ${precio:.2f} (via {proveedor})",
+                                    "success",
+                                )
                             )
-                        )
 
-                        self._resultados.append(
-                            {
-                                "hotel": nombre,
-                                "precio": precio,
-                                "proveedor": proveedor,
-                                "check_in": check_in,
-                                "check_out": check_out,
-                                "moneda": result.get("currency", "USD"),
-                            }
-                        )
-                    else:
-                        self._queue.put(
-                            ("log", f"✗ {nombre}: Not found", "warning")
-                        )
-                        self._resultados.append(
-                            {
-                                "hotel": nombre,
-                                "precio": None,
-                                "proveedor": None,
-                                "check_in": check_in,
-                                "check_out": check_out,
-                                "moneda": None,
-                            }
-                        )
+                            self._resultados.append(
+                                {
+                                    "hotel": nombre,
+                                    "precio": precio,
+                                    "proveedor": proveedor,
+                                    "check_in": check_in,
+                                    "check_out": check_out,
+                                    "moneda": result.get("currency", "USD"),
+                                }
+                            )
+                        else:
+                            self._queue.put(
+                                ("log", f"✗ {nombre}: Not found", "warning")
+                            )
+                            self._resultados.append(
+                                {
+                                    "hotel": nombre,
+                                    "precio": None,
+                                    "proveedor": None,
+                                    "check_in": check_in,
+                                    "check_out": check_out,
+                                    "moneda": None,
+                                }
+                            )
 
-                    # Actualizar stats
-                    stats = cascade.get_stats()
-                    self._queue.put(("stats", stats, None))
+                        # Actualizar stats
+                        stats = cascade.get_stats()
+                        self._queue.put(("stats", stats, None))
 
-                except Exception as e:
-                    self._queue.put(("log", f"✗ {nombre}: Error - {str(e)}", "error"))
+                    except Exception as e:
+                        self._queue.put(("log", f"✗ {nombre}: Error - {str(e)}", "error"))
 
             # Progreso final
             self._queue.put(("progress", total, total))
@@ -0,0 +1,9 @@
+"""
+Versión de la aplicación.
+
+Módulo hoja sin dependencias: la barra superior lo importa antes del primer
+pintado sin arrastrar requests/packaging (ver ui/utils/updater.py).
+"""
+
+# Application version - update this with each release
+APP_VERSION = "1.3.0"
@@ -170,6 +170,19 @@ def aplicar_tema(modo: TemaMode) -> None:
     ctk.set_default_color_theme("blue")
 
 
+def aplicar_modo(modo: TemaMode) -> None:
+    """
+    Cambia solo el modo de apariencia (sin recargar el color theme).
+
+    Para alternar oscuro/claro después de aplicar_tema: set_default_color_theme
+    relee el JSON del tema y solo afecta a widgets nuevos.
+
+    Args:
+        modo: "dark" para tema oscuro, "light" para tema claro.
+    """
+    ctk.set_appearance_mode(modo)
+
+
 def obtener_color_estado(estado: str, modo: TemaMode) -> str:
     """
     Obtiene el color para un estado específico.
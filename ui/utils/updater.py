@@ -17,10 +17,9 @@ from typing import Callable, Optional
 import requests
 from packaging import version
 
-logger = logging.getLogger(__name__)
+from ui.utils._version import APP_VERSION
 
-# Application version - update this with each release
-APP_VERSION = "1.3.0"
+logger = logging.getLogger(__name__)
 
 # GitHub repository info
 GITHUB_OWNER = "FulanoXpr"
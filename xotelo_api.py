@@ -57,7 +57,8 @@ class XoteloAPI:
         base_url: Optional[str] = None,
         timeout: Optional[int] = None,
         delay: Optional[float] = None,
-        max_retries: Optional[int] = None
+        max_retries: Optional[int] = None,
+        retry_delay: Optional[float] = None
     ) -> None:
         """
         Initialize the Xotelo API client.
@@ -67,11 +68,15 @@ class XoteloAPI:
             timeout: Request timeout in seconds (defaults to config.TIMEOUT)
             delay: Delay between requests in seconds (defaults to config.REQUEST_DELAY)
             max_retries: Maximum number of retries on failure (defaults to config.MAX_RETRIES)
+            retry_delay: Seconds to wait before a retry (defaults to config.RETRY_DELAY)
         """
         self.base_url = base_url or config.BASE_URL
         self.timeout = timeout or config.TIMEOUT
         self.delay = delay or config.REQUEST_DELAY
         self.max_retries = max_retries or config.MAX_RETRIES
+        self.retry_delay = (
+            config.RETRY_DELAY if retry_delay is None else retry_delay
+        )
         self.session = requests.Session()
 
     def _request(
@@ -106,14 +111,14 @@ class XoteloAPI:
             except requests.exceptions.Timeout:
                 logger.warning("Request timeout (attempt %d/%d)", attempt + 1, self.max_retries)
                 if attempt < self.max_retries - 1:
-                    time.sleep(config.RETRY_DELAY)
+                    time.sleep(self.retry_delay)
                     continue
                 return None
 
             except requests.exceptions.RequestException as e:
                 logger.error("Request failed: %s", e)
                 if attempt < self.max_retries - 1:
-                    time.sleep(config.RETRY_DELAY)
+                    time.sleep(self.retry_delay)
                     continue
                 return None
 
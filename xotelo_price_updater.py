@@ -17,6 +17,7 @@ import json
 import logging
 import os
 import sys
+from contextlib import nullcontext
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Tuple, TypedDict
 
@@ -365,7 +366,13 @@ def update_excel_with_prices(
     multi_date: bool = False,
     cascade_mode: bool = False
 ) -> str:
-    """Read Excel and update with prices, including snapshot date."""
+    """
+    Read Excel and update with prices, including snapshot date.
+
+    The source workbook is loaded in full (not read-only/write-only) so
+    the output keeps its formatting, tables and other sheets; only the
+    new price columns are written into the active sheet.
+    """
     logger.info("Updating Excel file...")
 
     wb: Workbook = openpyxl.load_workbook(EXCEL_FILE)
@@ -535,7 +542,8 @@ def main() -> None:
         # Initialize cache
         cache = PriceCache(
             cache_file=config.CACHE_FILE,
-            ttl_hours=config.CACHE_TTL_HOURS
+            ttl_hours=config.CACHE_TTL_HOURS,
+            max_entries=config.CACHE_MAX_ENTRIES
         )
         cache_stats = cache.get_stats()
         print(f"   Cache: {cache_stats['valid_entries']} valid entries")
@@ -555,8 +563,13 @@ def main() -> None:
 
     # Step 2: Load Excel and process hotels
     print("\n[STEP 2] Loading Excel and fetching prices by key...")
-    wb: Workbook = openpyxl.load_workbook(EXCEL_FILE)
-    ws: Worksheet = wb.active
+    # Read the name column once as plain values, then release the file
+    wb: Workbook = openpyxl.load_workbook(EXCEL_FILE, read_only=True)
+    hotel_names = [
+        values[0] if values else None
+        for values in wb.active.iter_rows(min_row=2, max_col=1, values_only=True)
+    ]
+    wb.close()
 
     # Initialize API client
     api = get_client()
@@ -570,144 +583,145 @@ def main() -> None:
     # Track date usage stats for multi-date mode
     date_stats: Dict[str, int] = {}
 
-    for row in range(2, ws.max_row + 1):
-        hotel_name = ws.cell(row=row, column=1).value
-
-        if not hotel_name:
-            continue
-
-        hotel_name = str(hotel_name).strip()
-        hotels_total += 1
-
-        # Check limit for testing
-        if args.limit > 0 and hotels_total > args.limit:
-            print(f"\n[LIMIT] Reached limit of {args.limit} hotels")
-            break
+    # Cascade runs save the price cache once at the end, not per hotel
+    batch = cascade_provider.cache.buffered() if cascade_provider else nullcontext()
+    with batch:
+        for row, hotel_name in enumerate(hotel_names, start=2):
+            if not hotel_name:
+                continue
 
-        hotel_data = hotel_keys.get(hotel_name)
-        hotel_key = get_xotelo_key(hotel_data)
-        booking_url = get_booking_url(hotel_data)
-        amadeus_id = get_amadeus_id(hotel_data)
+            hotel_name = str(hotel_name).strip()
+            hotels_total += 1
 
-        # CASCADE MODE
-        if args.cascade and cascade_provider:
-            hotels_with_key += 1  # In cascade mode, we try all hotels
-            print(f"\n[{hotels_total}] {hotel_name}")
-            if hotel_key:
-                print(f"    Key: {hotel_key}")
-            else:
-                print("    Key: None (will try SerpApi/Apify/Amadeus)")
-            if booking_url:
-                print(f"    Booking URL: {booking_url[:50]}...")
-            if amadeus_id:
-                print(f"    Amadeus ID: {amadeus_id}")
-
-            result = cascade_provider.get_price(
-                hotel_name,
-                hotel_key,
-                search_params['chk_in'],
-                search_params['chk_out'],
-                search_params['rooms'],
-                search_params['adults'],
-                booking_url=booking_url,
-                amadeus_id=amadeus_id
-            )
-
-            if result:
-                price = result['price']
-                provider = result['provider']
-                source = result['source']
-                cached = result['cached']
-                cache_label = " [cached]" if cached else ""
-
-                print(f"    Price: ${price:.2f} ({provider}) via {source}{cache_label}")
-
-                excel_hotels_with_prices[row] = HotelPriceData(
-                    price=price,
-                    provider=provider,
-                    hotel_key=hotel_key or '',
-                    source=source
-                )
-                hotels_with_prices += 1
-            else:
-                print("    No price available (all providers failed)")
-                excel_hotels_with_prices[row] = HotelPriceData(
-                    price=None,
-                    provider='N/A',
-                    hotel_key=hotel_key or '',
-                    source='none'
-                )
+            # Check limit for testing
+            if args.limit > 0 and hotels_total > args.limit:
+                print(f"\n[LIMIT] Reached limit of {args.limit} hotels")
+                break
 
-        # NON-CASCADE MODE (original behavior)
-        elif hotel_key:  # hotel_key is already extracted above
-            hotels_with_key += 1
-            print(f"\n[{hotels_with_key}] {hotel_name}")
-            print(f"    Key: {hotel_key}")
-            print("    Fetching price...")
-
-            if args.multi_date and date_ranges:
-                # Try multiple dates
-                result = try_multiple_dates(
-                    api,
+            hotel_data = hotel_keys.get(hotel_name)
+            hotel_key = get_xotelo_key(hotel_data)
+            booking_url = get_booking_url(hotel_data)
+            amadeus_id = get_amadeus_id(hotel_data)
+
+            # CASCADE MODE
+            if args.cascade and cascade_provider:
+                hotels_with_key += 1  # In cascade mode, we try all hotels
+                print(f"\n[{hotels_total}] {hotel_name}")
+                if hotel_key:
+                    print(f"    Key: {hotel_key}")
+                else:
+                    print("    Key: None (will try SerpApi/Apify/Amadeus)")
+                if booking_url:
+                    print(f"    Booking URL: {booking_url[:50]}...")
+                if amadeus_id:
+                    print(f"    Amadeus ID: {amadeus_id}")
+
+                result = cascade_provider.get_price(
+                    hotel_name,
                     hotel_key,
-                    date_ranges,
+                    search_params['chk_in'],
+                    search_params['chk_out'],
                     search_params['rooms'],
-                    search_params['adults']
+                    search_params['adults'],
+                    booking_url=booking_url,
+                    amadeus_id=amadeus_id
                 )
 
                 if result:
-                    rate_data, date_label = result
-                    price = rate_data['rate']
-                    provider = rate_data['provider']
-                    print(f"    Price: ${price:.2f} ({provider}) [found: {date_label}]")
+                    price = result['price']
+                    provider = result['provider']
+                    source = result['source']
+                    cached = result['cached']
+                    cache_label = " [cached]" if cached else ""
+
+                    print(f"    Price: ${price:.2f} ({provider}) via {source}{cache_label}")
 
                     excel_hotels_with_prices[row] = HotelPriceData(
                         price=price,
                         provider=provider,
-                        hotel_key=hotel_key,
-                        date_used=date_label
+                        hotel_key=hotel_key or '',
+                        source=source
                     )
                     hotels_with_prices += 1
-                    date_stats[date_label] = date_stats.get(date_label, 0) + 1
                 else:
-                    print("    No price available (tried all dates)")
+                    print("    No price available (all providers failed)")
                     excel_hotels_with_prices[row] = HotelPriceData(
                         price=None,
                         provider='N/A',
-                        hotel_key=hotel_key,
-                        date_used=''
+                        hotel_key=hotel_key or '',
+                        source='none'
                     )
-            else:
-                # Single date mode (original behavior)
-                rate_data = api.get_rates(
-                    hotel_key,
-                    search_params['chk_in'],
-                    search_params['chk_out'],
-                    search_params['rooms'],
-                    search_params['adults']
-                )
-
-                if rate_data:
-                    price = rate_data['rate']
-                    provider = rate_data['provider']
-                    print(f"    Price: ${price:.2f} ({provider})")
 
-                    excel_hotels_with_prices[row] = HotelPriceData(
-                        price=price,
-                        provider=provider,
-                        hotel_key=hotel_key
+            # NON-CASCADE MODE (original behavior)
+            elif hotel_key:  # hotel_key is already extracted above
+                hotels_with_key += 1
+                print(f"\n[{hotels_with_key}] {hotel_name}")
+                print(f"    Key: {hotel_key}")
+                print("    Fetching price...")
+
+                if args.multi_date and date_ranges:
+                    # Try multiple dates
+                    result = try_multiple_dates(
+                        api,
+                        hotel_key,
+                        date_ranges,
+                        search_params['rooms'],
+                        search_params['adults']
                     )
-                    hotels_with_prices += 1
+
+                    if result:
+                        rate_data, date_label = result
+                        price = rate_data['rate']
+                        provider = rate_data['provider']
+                        print(f"    Price: ${price:.2f} ({provider}) [found: {date_label}]")
+
+                        excel_hotels_with_prices[row] = HotelPriceData(
+                            price=price,
+                            provider=provider,
+                            hotel_key=hotel_key,
+                            date_used=date_label
+                        )
+                        hotels_with_prices += 1
+                        date_stats[date_label] = date_stats.get(date_label, 0) + 1
+                    else:
+                        print("    No price available (tried all dates)")
+                        excel_hotels_with_prices[row] = HotelPriceData(
+                            price=None,
+                            provider='N/A',
+                            hotel_key=hotel_key,
+                            date_used=''
+                        )
                 else:
-                    print("    No price available")
-                    excel_hotels_with_prices[row] = HotelPriceData(
-                        price=None,
-                        provider='N/A',
-                        hotel_key=hotel_key
+                    # Single date mode (original behavior)
+                    rate_data = api.get_rates(
+                        hotel_key,
+                        search_params['chk_in'],
+                        search_params['chk_out'],
+                        search_params['rooms'],
+                        search_params['adults']
                     )
-            api.wait()
-        else:
-            print(f"\n[SKIP] {hotel_name} - No key in database")
+
+                    if rate_data:
+                        price = rate_data['rate']
+                        provider = rate_data['provider']
+                        print(f"    Price: ${price:.2f} ({provider})")
+
+                        excel_hotels_with_prices[row] = HotelPriceData(
+                            price=price,
+                            provider=provider,
+                            hotel_key=hotel_key
+                        )
+                        hotels_with_prices += 1
+                    else:
+                        print("    No price available")
+                        excel_hotels_with_prices[row] = HotelPriceData(
+                            price=None,
+                            provider='N/A',
+                            hotel_key=hotel_key
+                        )
+                api.wait()
+            else:
+                print(f"\n[SKIP] {hotel_name} - No key in database")
 
     print(f"\n[STATS] Hotels in Excel: {hotels_total}")
     print(f"[STATS] Hotels with keys: {hotels_with_key}")